@@ -8,15 +8,35 @@ DinoBot 메인 애플리케이션
 """
 
 import asyncio
+import contextvars
+import dataclasses
+import functools
+import hmac
+import json
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
 
 import uvicorn
+
+try:
+    import uvloop  # C 구현 이벤트 루프 (선택 의존성)
+except ImportError:
+    uvloop = None
 from fastapi import FastAPI, Request, Header, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson 설치 시 C 구현 JSON 인코더 사용 (datetime 네이티브 지원)
+APIResponse = ORJSONResponse if orjson is not None else JSONResponse
 
 # 핵심 모듈들
 from src.core.config import settings
+from src.core.constants import NotionConstants, UserConstants, config_helper
 from src.core.dynamic_config import dynamic_config_manager
 from src.service.workflow.dynamic_command_service import dynamic_command_service
 from src.core.logger import (
@@ -31,12 +51,14 @@ from src.core.database import (
     log_system_event,
     save_notion_page,
     get_recent_notion_page_by_user,
+    notion_page_batcher,
+    metrics_collector as mongodb_metrics_collector,
 )
 from src.core.exceptions import global_exception_handler, UserInputException
 from src.core.global_error_handler import (
     handle_exception,
     ErrorSeverity,
-    setup_global_exception_handlers,
+    install_on_loop,
 )
 
 # 서비스 관리자
@@ -76,6 +98,297 @@ from src.dto.webhook import (
 # Logger initialization
 logger = get_logger("main")
 
+# 요청마다 settings 속성을 조회하지 않도록 런타임에 바뀌지 않는 값은 모듈 상수로 바인딩
+TZ = settings.tz
+FACTORY_DB_ID = settings.factory_tracker_db_id
+BOARD_DB_ID = settings.board_db_id
+
+# 공통 오류 응답 (DTO는 frozen이므로 인스턴스를 공유해도 안전)
+COMMAND_PROCESSING_ERROR_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 명령어 처리 중 오류가 발생했습니다.",
+    is_ephemeral=True,
+)
+UNSUPPORTED_COMMAND_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 지원하지 않는 명령어",
+    is_ephemeral=True,
+)
+STATS_ERROR_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 통계 조회 중 오류가 발생했습니다.",
+    is_ephemeral=True,
+)
+TASK_STATS_ERROR_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ Task 통계 조회 중 오류가 발생했습니다.",
+    is_ephemeral=True,
+)
+SEARCH_ERROR_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 검색 중 오류가 발생했습니다.",
+    is_ephemeral=True,
+)
+SEARCH_QUERY_TOO_SHORT_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 검색어는 2글자 이상 입력해주세요.",
+    is_ephemeral=True,
+)
+TASK_TITLE_REQUIRED_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 태스크 제목이 필요합니다. (title 또는 name 파라미터 필요)",
+    is_ephemeral=True,
+)
+TASK_PERSON_REQUIRED_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 담당자(person 또는 assignee)가 필요합니다. 사용 가능한 값: 소현, 정빈, 동훈",
+    is_ephemeral=True,
+)
+MEETING_TITLE_REQUIRED_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content="❌ 회의록 제목이 필요합니다. (title 또는 name 파라미터 필요)",
+    is_ephemeral=True,
+)
+DOCUMENT_TITLE_REQUIRED_RESPONSE = DiscordMessageResponseDTO(
+    message_type=MessageType.ERROR_NOTIFICATION,
+    content=config_helper.format_error_message("missing_title"),
+    is_ephemeral=True,
+)
+
+# 명령어별 필수 파라미터: ((대체 가능한 키들), 누락 시 응답) 순서대로 검사
+# (라우팅되는 워크플로우 서비스의 _validate_request와 같은 조건/메시지,
+#  담당자는 선택사항이라 제외 - 없으면 명령어 실행자로 지정됨)
+_TITLE_KEYS = ("title", "name")
+REQUIRED_PARAMS: Dict[CommandType, Tuple[Tuple[Tuple[str, ...], Any], ...]] = {
+    CommandType.TASK: ((_TITLE_KEYS, TASK_TITLE_REQUIRED_RESPONSE),),
+    CommandType.MEETING: ((_TITLE_KEYS, MEETING_TITLE_REQUIRED_RESPONSE),),
+    CommandType.DOCUMENT: ((_TITLE_KEYS, DOCUMENT_TITLE_REQUIRED_RESPONSE),),
+}
+
+# 마감일 파싱 실패 시 기본 마감 기한
+DEFAULT_DUE_OFFSET = timedelta(days=7)
+
+# 동시에 실행할 수 있는 백그라운드 자동 작업 최대 개수
+AUTO_TASK_LIMIT = 64
+
+# 무거운 명령어 종류별 동시 실행 상한 (초과 요청은 대기열에서 순서대로 처리)
+COMMAND_CONCURRENCY_LIMITS = {
+    CommandType.SEARCH: 4,
+    CommandType.DAILY_STATS: 8,
+    CommandType.WEEKLY_STATS: 8,
+    CommandType.MONTHLY_STATS: 8,
+    CommandType.USER_STATS: 8,
+    CommandType.TEAM_STATS: 8,
+    CommandType.TRENDS: 8,
+    CommandType.TASK_STATS: 8,
+}
+
+# 유효성 검증용 상수 (멤버십 검사는 frozenset, 안내 문구는 원래 순서로 미리 결합)
+VALID_PERSONS = frozenset(UserConstants.VALID_PERSONS)
+VALID_PERSONS_DISPLAY = ", ".join(UserConstants.VALID_PERSONS)
+VALID_DOC_TYPES = frozenset(NotionConstants.DOCUMENT_TYPES)
+VALID_DOC_TYPES_DISPLAY = ", ".join(NotionConstants.DOCUMENT_TYPES)
+
+# /help 안내 문구 (정적 문자열이므로 임포트 시 한 번만 생성)
+HELP_CONTENT = (
+    "🤖 **노션봇 사용 가이드**\n\n"
+    "**📝 태스크 관리**\n"
+    "> `/task person:[담당자] name:[제목] priority:[우선순위]`\n"
+    "> • **담당자**: 소현, 정빈, 동훈 중 선택 (필수)\n"
+    "> • **제목**: 태스크 제목 (필수)\n"
+    "> • **우선순위**: High, Medium, Low 중 선택 (선택사항)\n"
+    "> • **예시**: `/task person:정빈 name:버그수정 priority:High`\n\n"
+    "**📋 회의록 관리**\n"
+    "> `/meeting title:[제목] participants:[참석자]`\n"
+    "> • **제목**: 회의록 제목 (필수)\n"
+    "> • **참석자**: 소현, 정빈, 동훈 중 선택 (필수)\n"
+    "> • **예시**: `/meeting title:주간회의 participants:정빈,소현`\n\n"
+    "**📄 문서 생성**\n"
+    "> `/document title:[제목] doc_type:[문서타입]`\n"
+    "> • **문서타입**: 개발 문서, 기획안, 개발 규칙, 회의록\n"
+    "> • **예시**: `/document title:API설계서 doc_type:개발 문서`\n\n"
+    "**📄 페이지 내용 가져오기**\n"
+    "> `/fetch page_id:[노션페이지ID]`\n"
+    "> • 노션 페이지의 원본 내용을 스레드로 가져옵니다\n"
+    "> • page_id 미입력 시 최근 생성된 페이지 자동 선택\n"
+    "> • **예시**: `/fetch` 또는 `/fetch page_id:abc123def456...`\n\n"
+    "**🔍 페이지 검색**\n"
+    "> `/search query:[키워드] page_type:[타입] user:[사용자] days:[일수]`\n"
+    "> • **타입**: task, meeting, document, all (기본값: all)\n"
+    "> • **연관 검색어, 인기 검색어 자동 제안**\n"
+    "> • **예시**: `/search query:API page_type:document`\n\n"
+    "**📊 통계 조회**\n"
+    "> `/daily_stats [user:사용자]` - 일별 통계 (차트 포함)\n"
+    "> `/weekly_stats [user:사용자]` - 주별 통계 (차트 포함)\n"
+    "> `/monthly_stats [user:사용자]` - 월별 통계 (차트 포함)\n"
+    "> `/user_stats user:사용자` - 사용자별 생산성 통계\n"
+    "> `/team_stats` - 팀 전체 통계 및 협업 분석\n"
+    "> `/trends [days:일수]` - 활동 트렌드 분석 (기본 14일)\n"
+    "> `/task_stats [user:사용자] [status:상태]` - 태스크 완료율 통계\n\n"
+    "**👁️ 페이지 감시**\n"
+    "> `/watch page_id:[노션페이지ID] interval:[간격]`\n"
+    "> • 노션 페이지 변경사항을 주기적으로 확인 (개발 중)\n"
+    "> • **간격**: 분 단위 (기본 30분)\n\n"
+    "**🔧 시스템 정보**\n"
+    "> `/status` - 봇과 시스템 상태 확인\n"
+    "> `/help` - 이 도움말 표시\n\n"
+    "**💡 팁**\n"
+    "> • 모든 알림은 당일 스레드에 자동으로 전송됩니다\n"
+    "> • 페이지 생성 시 페이지 ID가 자동으로 제공됩니다\n"
+    "> • 검색 시 연관 검색어와 인기 검색어가 자동 제안됩니다\n"
+    "> • 통계는 차트 이미지로 시각화되어 제공됩니다\n\n"
+    "**📊 데이터베이스**\n"
+    "> • **Factory Tracker**: 태스크 관리\n"
+    "> • **Board**: 회의록 및 문서 관리"
+)
+
+# 회의록 생성 안내 메시지의 고정 작성 가이드 부분
+MEETING_GUIDE_TAIL = (
+    "\n**📋 작성 가이드**\n"
+    "> • **Agenda**: 회의 주제 및 목표\n"
+    "> • **Discussion**: 주요 논의 content\n"
+    "> • **Decisions**: 확정된 결정 사항들\n"
+    "> • **Action Items**: assignee별 할 일과 due_date\n\n"
+    "✨ 작성 완료 후 `/fetch` 명령어로 내용을 이 스레드로 가져올 수 있습니다!"
+)
+
+# 명령어 처리 시작 시각 (요청 단위로 한 번만 계산해 워크플로우에서 재사용)
+_request_now: contextvars.ContextVar[Optional[datetime]] = contextvars.ContextVar(
+    "request_now", default=None
+)
+
+
+# 통계 메시지 스냅샷 캐시 (백그라운드에서 주기적으로 갱신, stats_cache_ttl 지나면 요청 시 재계산)
+STATS_CACHE_MAX_SIZE = 256
+_stats_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+# 통계 이름 → (분석 서비스 메서드명, 메시지 포맷 타입, 오류 메시지용 라벨)
+STATS_SOURCES = {
+    "team_stats": ("get_team_comparison_stats", "team", "팀 비교 통계"),
+    "trends": ("get_activity_trends_stats", "trends", "활동 트렌드 통계"),
+    "task_stats": ("get_task_completion_stats", "task_completion", "태스크 완료 통계"),
+}
+# 백그라운드에서 미리 계산해 둘 조회 기간
+STATS_REFRESH_DAYS = (7, 14, 30, 90)
+
+
+def _next_run_at(now: datetime, hour: int, weekday: Optional[int] = None) -> datetime:
+    """now 이후 가장 가까운 정각 실행 시각 (weekday 지정 시 해당 요일, 0=월요일)"""
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if weekday is not None:
+        next_run += timedelta(days=(weekday - next_run.weekday()) % 7)
+    if next_run <= now:
+        next_run += timedelta(days=1 if weekday is None else 7)
+    return next_run
+
+
+# 실시간 대시보드 데이터 캐시 (/status, /metrics/dashboard 공용, 동시 요청은 한 번만 집계)
+DASHBOARD_CACHE_TTL = 15.0
+_dashboard_cache: Dict[str, Any] = {"value": None, "expires_at": 0.0}
+_dashboard_lock = asyncio.Lock()
+
+
+async def _get_cached_dashboard(ttl: float = DASHBOARD_CACHE_TTL) -> Dict[str, Any]:
+    """TTL 동안 대시보드 데이터를 재사용하고, 만료 시 락 안에서 한 번만 재계산"""
+    if time.monotonic() < _dashboard_cache["expires_at"]:
+        return _dashboard_cache["value"]
+
+    async with _dashboard_lock:
+        # 락 대기 중 다른 요청이 이미 갱신했으면 그 결과 사용
+        if time.monotonic() < _dashboard_cache["expires_at"]:
+            return _dashboard_cache["value"]
+
+        dashboard_data = (
+            await get_mongodb_analysis_service().generate_realtime_dashboard_data()
+        )
+        _dashboard_cache["value"] = dashboard_data
+        _dashboard_cache["expires_at"] = time.monotonic() + ttl
+        return dashboard_data
+
+
+def _missing_param_response(
+    command_type: CommandType, parameters: Dict[str, Any]
+) -> Optional[DiscordMessageResponseDTO]:
+    """필수 파라미터가 빠졌으면 해당 오류 응답, 모두 있으면 None"""
+    for keys, response in REQUIRED_PARAMS.get(command_type, ()):
+        if not any(parameters.get(key) for key in keys):
+            return response
+    return None
+
+
+def _secret_matches(provided: Optional[str], expected: str) -> bool:
+    """웹훅 시크릿을 상수 시간으로 비교 (타이밍 공격 방지)"""
+    return hmac.compare_digest((provided or "").encode(), expected.encode())
+
+
+async def _read_body_capped(request: Request, max_bytes: int) -> bytes:
+    """요청 본문을 스트리밍으로 읽되 max_bytes 초과 시 즉시 413으로 중단"""
+    content_length = request.headers.get("content-length")
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > max_bytes
+    ):
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    chunks = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _probe_mongodb() -> bool:
+    """MongoDB ping으로 실제 연결 상태 확인"""
+    if not mongodb_connection.mongo_client:
+        return False
+    try:
+        await mongodb_connection.mongo_client.admin.command("ping")
+        return True
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _minute_suffix(minute_key: int) -> str:
+    """분 단위 키(epoch 분)를 설정 타임존의 HH:MM 문자열로 변환 (같은 분 내 호출은 캐시 재사용)"""
+    return datetime.fromtimestamp(minute_key * 60, TZ).strftime("%H:%M")
+
+
+def _part_label(index: int, total_parts: int) -> str:
+    """분할 메시지 앞에 붙는 [i/n] 라벨 (한 조각이면 빈 문자열)"""
+    return f"**[{index + 1}/{total_parts}]**\n" if total_parts > 1 else ""
+
+
+def _split_text_by_lines(page_text: str, max_length: int) -> List[str]:
+    """긴 텍스트를 줄 단위로 max_length 이하 조각으로 분할 (줄 경계 오프셋만 추적하고 조각마다 원본에서 한 번만 슬라이스)"""
+    text_len = len(page_text)
+    if text_len <= max_length:
+        return [page_text]
+
+    text_parts: List[str] = []
+    chunk_start = 0
+    chunk_len = 0
+    line_start = 0
+    while True:
+        newline = page_text.find("\n", line_start)
+        line_end = text_len if newline == -1 else newline
+        line_len = line_end - line_start + 1
+        if chunk_len and chunk_len + line_len > max_length:
+            text_parts.append(page_text[chunk_start : line_start - 1].rstrip())
+            chunk_start = line_start
+            chunk_len = 0
+        chunk_len += line_len
+        if newline == -1:
+            break
+        line_start = newline + 1
+
+    text_parts.append(page_text[chunk_start:].rstrip())
+    return text_parts
+
 
 class ServiceManager(IServiceManager):
     """
@@ -104,6 +417,7 @@ class ServiceManager(IServiceManager):
             version="2.0.0",
             docs_url="/docs",
             redoc_url="/redoc",
+            default_response_class=APIResponse,
         )
 
         # 시스템 상태
@@ -111,6 +425,28 @@ class ServiceManager(IServiceManager):
         self.service_ready = False
         self.auto_tasks = []
 
+        # 동일 요청 중복 실행 방지용 진행 중 작업 (key → 공유 Task)
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
+        # 명령어 종류별 동시 실행 제한 세마포어
+        self._command_sems = {
+            command_type: asyncio.Semaphore(limit)
+            for command_type, limit in COMMAND_CONCURRENCY_LIMITS.items()
+        }
+
+        # 기본 Discord 채널 (요청마다 settings 조회하지 않도록 시작 시 한 번 계산)
+        self._default_channel_id = (
+            settings.discord_channel_id or settings.default_discord_channel_id
+        )
+
+        # 스레드 메시지 동시 전송 상한 (Discord 채널별 rate limit 준수)
+        self._discord_send_sem = asyncio.Semaphore(
+            settings.discord_send_concurrency or 4
+        )
+
+        # 명령어 디스패치 테이블
+        self._command_handlers = self._build_command_handlers()
+
         # 통합 서비스 관리자 초기화 완료 (로그 제거)
 
     # ===== I통합_서비스_관리자 인터페이스 구현 =====
@@ -143,31 +479,31 @@ class ServiceManager(IServiceManager):
 
     async def initialize_system(self) -> bool:
         """전체 시스템을 순차적으로 초기화"""
-        self.start_time = datetime.now(settings.tz)
+        self.start_time = self._now()
         logger.info("🚀 DinoBot 시스템 초기화 시작")
 
-        # 전역 예외 처리기 설정
-        setup_global_exception_handlers()
+        # 실행 중인 이벤트 루프에 asyncio 예외 처리기 설치
+        loop = asyncio.get_running_loop()
+        install_on_loop(loop)
+
+        # 즉시 완료되는 코루틴은 스케줄링 없이 인라인 실행 (Python 3.12+)
+        # uvicorn 서버도 같은 루프에서 serve()되므로 함께 적용됨
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            loop.set_task_factory(eager_task_factory)
 
         try:
-            # 1. MongoDB 연결
+            # 1. MongoDB 연결 및 노션 페이지/메트릭 배치 저장 워커 시작
             await mongodb_connection.connect_database()
+            notion_page_batcher.start()
+            mongodb_metrics_collector.start()
 
-            # 2. DinoBot 서비스 컬렉션 초기화
-            collection_result = await initialize_meetup_loader_collections()
-
-            # 초기화 결과 로깅
-            await log_system_event(
-                event_type="collections_initialized",
-                description=f"컬렉션 초기화 완료: {collection_result['total_collections']}개 (신규: {len(collection_result['created_collections'])}개)",
-                severity="info",
-                metadata=collection_result,
-            )
-
-            # 3. 설정 관리자 초기화
+            # 2~3. 컬렉션 초기화와 설정 관리자 초기화는 서로 독립적이므로 동시에 실행
             from src.core.config_manager import config_manager
 
-            await config_manager.initialize()
+            await asyncio.gather(
+                self._initialize_collections(), config_manager.initialize()
+            )
 
             # 3.5. 설정 상태 확인 및 조건부 초기화
             if config_manager.is_fully_configured():
@@ -187,8 +523,8 @@ class ServiceManager(IServiceManager):
 
             # 4. 서비스별 초기화는 조건부 초기화에서 처리됨
 
-            # 5. 초기 데이터 동기화 완료 대기
-            await asyncio.sleep(5)  # 동기화 완료 대기
+            # 5. 초기 데이터 동기화 완료 대기 (동기화 모니터가 실행 중일 때만)
+            await self._wait_for_initial_sync()
 
             # 6. Discord 봇 초기화 (전체 서비스 모드에서만)
             if config_manager.is_fully_configured():
@@ -213,11 +549,10 @@ class ServiceManager(IServiceManager):
             # 8. 글로벌 예외 핸들러 설정
             self._setup_exception_handlers()
 
-            # 9. 자동 관리 작업 시작
-            await self._start_auto_tasks()
-
-            # 10. 실시간 모니터링 시작
-            await start_realtime_performance_monitoring()
+            # 9~10. 자동 관리 작업과 실시간 모니터링 동시 시작
+            await asyncio.gather(
+                self._start_auto_tasks(), start_realtime_performance_monitoring()
+            )
 
             self.service_ready = True
             logger.info("✅ 전체 시스템 초기화 완료")
@@ -234,15 +569,7 @@ class ServiceManager(IServiceManager):
 
         try:
             # 자동 작업들 취소
-            if self.auto_tasks:
-                logger.info("⏹️ 백그라운드 작업들 종료 중...")
-                for task in self.auto_tasks:
-                    if not task.done():
-                        task.cancel()
-                try:
-                    await asyncio.gather(*self.auto_tasks, return_exceptions=True)
-                except asyncio.CancelledError:
-                    pass  # 취소된 작업들은 정상
+            await self._close_auto_tasks()
 
             # Notion 동기화 서비스 종료
             logger.info("🔄 Notion 동기화 서비스 종료 중...")
@@ -271,7 +598,9 @@ class ServiceManager(IServiceManager):
             except KeyError:
                 logger.warning("⚠️ Discord 서비스가 비활성화되어 있습니다.")
 
-            # MongoDB 연결 종료
+            # 대기 중인 노션 페이지/메트릭 배치 저장 후 MongoDB 연결 종료
+            await notion_page_batcher.stop()
+            await mongodb_metrics_collector.stop()
             logger.info("🗄️ MongoDB 연결 종료 중...")
             try:
                 disconnect_result = mongodb_connection.disconnect()
@@ -302,9 +631,10 @@ class ServiceManager(IServiceManager):
                 else {"ready": False, "response_time": 0.0}
             )
 
-            # 업타임 계산
+            # 업타임 계산 (점검 시각은 한 번만 구해 모든 상태 DTO에 공유)
+            checked_at = datetime.now()
             uptime_seconds = (
-                (datetime.now(settings.tz) - self.start_time).total_seconds()
+                (self._now() - self.start_time).total_seconds()
                 if self.start_time
                 else 0
             )
@@ -314,6 +644,7 @@ class ServiceManager(IServiceManager):
                 ServiceStatusDTO(
                     service_name="MongoDB",
                     is_healthy=mongodb_connection.connection_status,
+                    last_check=checked_at,
                     response_time_ms=mongo_response_time,
                     error_message=(
                         None
@@ -324,6 +655,7 @@ class ServiceManager(IServiceManager):
                 ServiceStatusDTO(
                     service_name="Discord Bot",
                     is_healthy=discord_status.get("ready", False),
+                    last_check=checked_at,
                     response_time_ms=discord_status.get("response_time", 0.0),
                     error_message=(
                         None if discord_status.get("ready") else "Discord bot not ready"
@@ -348,6 +680,7 @@ class ServiceManager(IServiceManager):
                 uptime_seconds=int(uptime_seconds),
                 services=services_dict,
                 mongodb=mongodb_status,
+                last_updated=checked_at,
             )
 
         except Exception as status_check_error:
@@ -368,85 +701,99 @@ class ServiceManager(IServiceManager):
 
     # ===== 비즈니스 로직 구현 =====
 
+    def _build_command_handlers(self) -> Dict[CommandType, Any]:
+        """명령어 타입 → 처리 코루틴 함수 매핑 (디스패치를 dict 조회 1회로)"""
+        return {
+            # 워크플로우 서비스를 통한 명령어 처리
+            CommandType.TASK: functools.partial(
+                self._run_workflow_service, "task", "create_task"
+            ),
+            CommandType.MEETING: functools.partial(
+                self._run_workflow_service, "meeting", "create_meeting"
+            ),
+            CommandType.DOCUMENT: functools.partial(
+                self._run_workflow_service, "document", "create_document"
+            ),
+            # 기존 워크플로우들은 기존 메서드 유지
+            CommandType.STATUS: self._status_check_workflow,
+            CommandType.FETCH_PAGE: self._fetch_page_workflow,
+            CommandType.WATCH_PAGE: self._watch_page_workflow,
+            CommandType.HELP: self._help_workflow,
+            CommandType.DAILY_STATS: self._daily_stats_workflow,
+            CommandType.WEEKLY_STATS: self._weekly_stats_workflow,
+            CommandType.MONTHLY_STATS: self._monthly_stats_workflow,
+            CommandType.USER_STATS: self._user_stats_workflow,
+            CommandType.TEAM_STATS: self._team_stats_workflow,
+            CommandType.TRENDS: self._trends_workflow,
+            CommandType.TASK_STATS: self._task_stats_workflow,
+            CommandType.SEARCH: self._search_workflow,
+            # CRUD Update/Archive 워크플로우들
+            CommandType.UPDATE_TASK: self._update_task_workflow,
+            CommandType.UPDATE_MEETING: self._update_meeting_workflow,
+            CommandType.UPDATE_DOCUMENT: self._update_document_workflow,
+            CommandType.ARCHIVE_PAGE: self._archive_page_workflow,
+            CommandType.RESTORE_PAGE: self._restore_page_workflow,
+            CommandType.CAREEROS_ONBOARD: self._careeros_onboard_workflow,
+            CommandType.CAREEROS_STATUS: self._careeros_status_workflow,
+            CommandType.CAREEROS_RESTART: self._careeros_restart_workflow,
+        }
+
+    async def _run_workflow_service(
+        self, service_name: str, method_name: str, request: DiscordCommandRequestDTO
+    ) -> DiscordMessageResponseDTO:
+        """워크플로우 서비스 메서드 호출 (서비스는 호출 시점에 조회)"""
+        workflow_service = self._service_manager.get_workflow_service(service_name)
+        return await getattr(workflow_service, method_name)(request)
+
+    @staticmethod
+    def _now() -> datetime:
+        """설정된 타임존 기준 현재 시각"""
+        return datetime.now(TZ)
+
     def _generate_unique_title(self, base_title: str) -> str:
         """제목에 시간 구분자를 추가하여 중복 방지"""
-        now = datetime.now(settings.tz)
-        time_suffix = now.strftime("%H:%M")
+        now = _request_now.get() or self._now()
+        time_suffix = _minute_suffix(int(now.timestamp() // 60))
         return f"{base_title} ({time_suffix})"
 
     async def _process_command_business_logic(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """디스코드 명령어의 비즈니스 로직 처리"""
+        now_token = _request_now.set(self._now())
         try:
-            # 워크플로우 서비스를 통한 명령어 처리
-            if request.command_type == CommandType.TASK:
-                task_service = self._service_manager.get_workflow_service("task")
-                return await task_service.create_task(request)
-            elif request.command_type == CommandType.MEETING:
-                meeting_service = self._service_manager.get_workflow_service("meeting")
-                return await meeting_service.create_meeting(request)
-            elif request.command_type == CommandType.DOCUMENT:
-                document_service = self._service_manager.get_workflow_service(
-                    "document"
-                )
-                return await document_service.create_document(request)
-            # 기존 워크플로우들은 기존 메서드 유지
-            elif request.command_type == CommandType.STATUS:
-                return await self._status_check_workflow(request)
-            elif request.command_type == CommandType.FETCH_PAGE:
-                return await self._fetch_page_workflow(request)
-            elif request.command_type == CommandType.WATCH_PAGE:
-                return await self._watch_page_workflow(request)
-            elif request.command_type == CommandType.HELP:
-                return await self._help_workflow(request)
-            elif request.command_type == CommandType.DAILY_STATS:
-                return await self._daily_stats_workflow(request)
-            elif request.command_type == CommandType.WEEKLY_STATS:
-                return await self._weekly_stats_workflow(request)
-            elif request.command_type == CommandType.MONTHLY_STATS:
-                return await self._monthly_stats_workflow(request)
-            elif request.command_type == CommandType.USER_STATS:
-                return await self._user_stats_workflow(request)
-            elif request.command_type == CommandType.TEAM_STATS:
-                return await self._team_stats_workflow(request)
-            elif request.command_type == CommandType.TRENDS:
-                return await self._trends_workflow(request)
-            elif request.command_type == CommandType.TASK_STATS:
-                return await self._task_stats_workflow(request)
-            elif request.command_type == CommandType.SEARCH:
-                return await self._search_workflow(request)
-            # CRUD Update/Archive 워크플로우들
-            elif request.command_type == CommandType.UPDATE_TASK:
-                return await self._update_task_workflow(request)
-            elif request.command_type == CommandType.UPDATE_MEETING:
-                return await self._update_meeting_workflow(request)
-            elif request.command_type == CommandType.UPDATE_DOCUMENT:
-                return await self._update_document_workflow(request)
-            elif request.command_type == CommandType.ARCHIVE_PAGE:
-                return await self._archive_page_workflow(request)
-            elif request.command_type == CommandType.RESTORE_PAGE:
-                return await self._restore_page_workflow(request)
-            elif request.command_type == CommandType.CAREEROS_ONBOARD:
-                return await self._careeros_onboard_workflow(request)
-            elif request.command_type == CommandType.CAREEROS_STATUS:
-                return await self._careeros_status_workflow(request)
-            elif request.command_type == CommandType.CAREEROS_RESTART:
-                return await self._careeros_restart_workflow(request)
-            else:
-                return DiscordMessageResponseDTO(
-                    message_type=MessageType.ERROR_NOTIFICATION,
+            handler = self._command_handlers.get(request.command_type)
+            if handler is None:
+                return dataclasses.replace(
+                    UNSUPPORTED_COMMAND_RESPONSE,
                     content=f"❌ 지원하지 않는 명령어: {request.command_type}",
-                    is_ephemeral=True,
                 )
 
+            # 필수 파라미터 누락/짧은 검색어는 워크플로우 코루틴 생성/세마포어 대기 전에 거절
+            missing_response = _missing_param_response(
+                request.command_type, request.parameters
+            )
+            if missing_response is not None:
+                return missing_response
+            if (
+                request.command_type == CommandType.SEARCH
+                and not request.typed_params.has_search_query
+            ):
+                return SEARCH_QUERY_TOO_SHORT_RESPONSE
+
+            sem = self._command_sems.get(request.command_type)
+            if sem is None:
+                return await handler(request)
+            if sem.locked():
+                logger.info("⏳ %s 동시 실행 한도 도달, 대기 중", request.command_type)
+            async with sem:
+                return await handler(request)
+
         except Exception as processing_error:
             logger.error(f"❌ 명령어 비즈니스 로직 처리 실패: {processing_error}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 명령어 처리 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return COMMAND_PROCESSING_ERROR_RESPONSE
+        finally:
+            _request_now.reset(now_token)
 
     async def _task_creation_workflow(
         self, request: DiscordCommandRequestDTO
@@ -458,25 +805,16 @@ class ServiceManager(IServiceManager):
             person = request.parameters.get("person") or request.parameters.get("assignee")
 
             if not base_title:
-                return DiscordMessageResponseDTO(
-                    message_type=MessageType.ERROR_NOTIFICATION,
-                    content="❌ 태스크 제목이 필요합니다. (title 또는 name 파라미터 필요)",
-                    is_ephemeral=True,
-                )
+                return TASK_TITLE_REQUIRED_RESPONSE
 
             if not person:
-                return DiscordMessageResponseDTO(
-                    message_type=MessageType.ERROR_NOTIFICATION,
-                    content="❌ 담당자(person 또는 assignee)가 필요합니다. 사용 가능한 값: 소현, 정빈, 동훈",
-                    is_ephemeral=True,
-                )
+                return TASK_PERSON_REQUIRED_RESPONSE
 
             # 담당자 유효성 검증
-            valid_persons = ["소현", "정빈", "동훈"]
-            if person not in valid_persons:
+            if person not in VALID_PERSONS:
                 return DiscordMessageResponseDTO(
                     message_type=MessageType.ERROR_NOTIFICATION,
-                    content=f"❌ 올바른 담당자를 선택해주세요: {', '.join(valid_persons)}",
+                    content=f"❌ 올바른 담당자를 선택해주세요: {VALID_PERSONS_DISPLAY}",
                     is_ephemeral=True,
                 )
 
@@ -497,11 +835,11 @@ class ServiceManager(IServiceManager):
                 if due_date and isinstance(due_date, str):
                     try:
                         due_date = datetime.fromisoformat(due_date)
-                    except:
-                        due_date = datetime.now() + timedelta(days=7)
+                    except ValueError:
+                        due_date = self._now() + DEFAULT_DUE_OFFSET
                 elif not due_date:
                     # 기본값: 오늘 마감
-                    due_date = datetime.now().replace(
+                    due_date = self._now().replace(
                         hour=23, minute=59, second=59, microsecond=0
                     )
 
@@ -540,55 +878,43 @@ class ServiceManager(IServiceManager):
                     description=task_request.description,
                 )
 
-                # 3. 생성된 페이지 정보를 데이터베이스에 저장
-                try:
-                    await save_notion_page(
-                        page_id=notion_result.get("id", ""),
-                        database_id=settings.factory_tracker_db_id,  # Factory Tracker DB ID
-                        page_type="task",
-                        title=task_request.task_name,
-                        created_by=str(request.user.user_id),
-                        metadata={
-                            "assignee": task_request.assignee,
-                            "priority": task_request.priority,
-                            "due_date": task_request.due_date,
-                            "discord_user": request.user.username,
-                        },
-                    )
-                except Exception as save_error:
-                    logger.warning(f"⚠️ 페이지 정보 저장 실패 (계속 진행): {save_error}")
-
-            # 3. 당일 스레드에 태스크 생성 알림 전송
+            # 3. 페이지 정보 저장(MongoDB) / 당일 스레드 조회(Discord) / URL 추출을 동시에 수행
             # Discord 명령어에서 자동으로 channel_id 추출
             channel_id = request.guild.channel_id if request.guild else None
             logger.info(
                 f"🔍 추출된 channel_id: {channel_id} (guild_id: {request.guild.guild_id if request.guild else None})"
             )
 
-            if channel_id:
-                thread_info = await self._discord_service.get_or_create_daily_thread(
-                    channel_id, title=task_request.task_name
-                )
-            else:
-                # channel_id가 없는 경우 기본 채널 사용
-                default_channel_id = getattr(
-                    settings, "discord_channel_id", None
-                ) or getattr(settings, "default_discord_channel_id", None)
-                if default_channel_id:
-                    thread_info = (
-                        await self._discord_service.get_or_create_daily_thread(
-                            default_channel_id, title=task_request.task_name
-                        )
-                    )
-                else:
-                    # 기본 채널도 없으면 스레드 생성 건너뛰기
-                    logger.warning("Discord 채널 ID가 설정되지 않아 스레드 생성 건너뜀")
-                    # 스레드 없이도 계속 진행
-                    thread_info = None
+            save_result, thread_info, page_url = await asyncio.gather(
+                save_notion_page(
+                    page_id=notion_result.get("id", ""),
+                    database_id=FACTORY_DB_ID,  # Factory Tracker DB ID
+                    page_type="task",
+                    title=task_request.task_name,
+                    created_by=str(request.user.user_id),
+                    metadata={
+                        "assignee": task_request.assignee,
+                        "priority": task_request.priority,
+                        "due_date": task_request.due_date,
+                        "discord_user": request.user.username,
+                    },
+                ),
+                self._get_task_daily_thread(channel_id, task_request.task_name),
+                self._notion_service.extract_page_url(notion_result),
+                return_exceptions=True,
+            )
+
+            if isinstance(save_result, Exception):
+                logger.warning(f"⚠️ 페이지 정보 저장 실패 (계속 진행): {save_result}")
+            if isinstance(thread_info, Exception):
+                # 스레드 조회 실패 시 알림만 건너뜀
+                logger.warning(f"⚠️ 당일 스레드 조회 실패 (알림 생략): {thread_info}")
+                thread_info = None
+            if isinstance(page_url, Exception):
+                page_url = notion_result.get("url", "")
 
             # 4. 스레드에 알림 전송
             if thread_info:
-                page_url = await self._notion_service.extract_page_url(notion_result)
                 task_notification = (
                     f"🎯 **새 태스크 생성됨**\n\n"
                     f"👤 **담당자**: {task_request.assignee}\n"
@@ -607,7 +933,8 @@ class ServiceManager(IServiceManager):
             # 4. 성공 응답 생성
             formatted_due_date = due_date.strftime("%Y-%m-%d %H:%M")
             page_url = notion_result.get("url", "https://notion.so")
-            response_content = (
+            # 응답 조각을 리스트에 모은 뒤 한 번에 결합
+            response_parts = [
                 f"✅ **태스크 생성 완료**\n"
                 f"👤 **담당자**: `{task_request.assignee}`\n"
                 f"📝 **제목**: `{base_title}` → `{task_request.task_name}`\n"
@@ -615,10 +942,12 @@ class ServiceManager(IServiceManager):
                 f"📅 **마감일**: `{formatted_due_date}` {due_date_indicator}\n"
                 f"🔗 **노션 링크**: {page_url}\n\n"
                 f"📢 스레드에 알림이 전송되었습니다!"
-            )
+            ]
 
             if task_request.due_date:
-                response_content += f"\n📅 **due_date**: `{task_request.due_date}`"
+                response_parts.append(f"\n📅 **due_date**: `{task_request.due_date}`")
+
+            response_content = "".join(response_parts)
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
@@ -636,6 +965,24 @@ class ServiceManager(IServiceManager):
                 is_ephemeral=True,
             )
 
+    async def _get_task_daily_thread(self, channel_id, title: str):
+        """태스크 알림용 당일 스레드 조회 (channel_id가 없으면 기본 채널 사용)"""
+        if channel_id:
+            return await self._discord_service.get_or_create_daily_thread(
+                channel_id, title=title
+            )
+
+        # channel_id가 없는 경우 기본 채널 사용
+        default_channel_id = self._default_channel_id
+        if default_channel_id:
+            return await self._discord_service.get_or_create_daily_thread(
+                default_channel_id, title=title
+            )
+
+        # 기본 채널도 없으면 스레드 생성 건너뛰기 (스레드 없이도 계속 진행)
+        logger.warning("Discord 채널 ID가 설정되지 않아 스레드 생성 건너뜀")
+        return None
+
     async def _meeting_creation_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
@@ -647,11 +994,7 @@ class ServiceManager(IServiceManager):
             participants = request.parameters.get("participants", [])
 
             if not base_title:
-                return DiscordMessageResponseDTO(
-                    message_type=MessageType.ERROR_NOTIFICATION,
-                    content="❌ 회의록 제목이 필요합니다.",
-                    is_ephemeral=True,
-                )
+                return MEETING_TITLE_REQUIRED_RESPONSE
 
             if not meeting_time:
                 return DiscordMessageResponseDTO(
@@ -678,14 +1021,13 @@ class ServiceManager(IServiceManager):
                 participants = [p.strip() for p in participants.split(",")]
 
             # 참석자 유효성 검증
-            valid_persons = ["소현", "정빈", "동훈"]
-            invalid_participants = [p for p in participants if p not in valid_persons]
+            invalid_participants = [p for p in participants if p not in VALID_PERSONS]
             if invalid_participants:
                 return DiscordMessageResponseDTO(
                     message_type=MessageType.ERROR_NOTIFICATION,
                     content=f"❌ 올바른 참석자를 선택해주세요.\n"
                     f"잘못된 참석자: {', '.join(invalid_participants)}\n"
-                    f"사용 가능한 값: {', '.join(valid_persons)}",
+                    f"사용 가능한 값: {VALID_PERSONS_DISPLAY}",
                     is_ephemeral=True,
                 )
 
@@ -712,7 +1054,7 @@ class ServiceManager(IServiceManager):
                 try:
                     await save_notion_page(
                         page_id=notion_result.get("id", ""),
-                        database_id=settings.board_db_id,  # Board DB ID
+                        database_id=BOARD_DB_ID,  # Board DB ID
                         page_type="meeting",
                         title=meeting_request.title,
                         created_by=str(request.user.user_id),
@@ -875,30 +1217,34 @@ class ServiceManager(IServiceManager):
                     logger.warning(f"⚠️ 스레드 메시지 전송 실패: {thread_error}")
 
             # 5. 성공 응답 생성
-            response_content = (
+            # 응답 조각을 리스트에 모은 뒤 한 번에 결합
+            response_parts = [
                 f"✅ **회의록 생성 완료**\n"
                 f"📝 **제목**: `{base_title}` → `{meeting_request.title}`\n"
                 f"🏷️ **유형**: `{meeting_request.meeting_type}`\n"
                 f"🔗 **노션 링크**: {page_url}\n\n"
                 f"📝 당일 스레드에 작성 가이드를 전송했습니다."
-            )
+            ]
 
             if meeting_request.attendees:
-                participants_string = ", ".join(meeting_request.attendees)
-                response_content += f"\n👥 **참석자**: `{participants_string}`"
+                response_parts.append(
+                    f"\n👥 **참석자**: `{', '.join(meeting_request.attendees)}`"
+                )
 
             # Discord 이벤트 생성 결과 추가
             if meeting_date_str:
-                response_content += f"\n🎯 **회의 일정**: `{meeting_date_str}`"
+                response_parts.append(f"\n🎯 **회의 일정**: `{meeting_date_str}`")
                 if discord_event_created:
-                    response_content += (
-                        f"\n📅 Discord 이벤트가 '내 회의실' 음성 채널에 생성되었습니다."
+                    response_parts.append(
+                        "\n📅 Discord 이벤트가 '내 회의실' 음성 채널에 생성되었습니다."
                     )
                 else:
-                    response_content += (
-                        f"\n⚠️ Discord 이벤트 생성에 실패했습니다. (날짜 형식 확인 필요)"
+                    response_parts.append(
+                        "\n⚠️ Discord 이벤트 생성에 실패했습니다. (날짜 형식 확인 필요)"
                     )
 
+            response_content = "".join(response_parts)
+
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
                 title="회의록 생성 완료",
@@ -925,20 +1271,15 @@ class ServiceManager(IServiceManager):
             doc_type = request.parameters.get("doc_type", "개발 문서")  # 기본값
 
             if not title:
-                return DiscordMessageResponseDTO(
-                    message_type=MessageType.ERROR_NOTIFICATION,
-                    content="❌ 문서 제목이 필요합니다.",
-                    is_ephemeral=True,
-                )
+                return DOCUMENT_TITLE_REQUIRED_RESPONSE
 
             # 문서 타입 유효성 검증 (Notion의 실제 Status 옵션과 일치)
-            valid_doc_types = ["개발 문서", "기획안", "개발 규칙", "회의록"]
-            if doc_type not in valid_doc_types:
+            if doc_type not in VALID_DOC_TYPES:
                 return DiscordMessageResponseDTO(
                     message_type=MessageType.ERROR_NOTIFICATION,
                     content=f"❌ 올바른 문서 타입을 선택해주세요.\n"
                     f"잘못된 타입: {doc_type}\n"
-                    f"사용 가능한 값: {', '.join(valid_doc_types)}",
+                    f"사용 가능한 값: {VALID_DOC_TYPES_DISPLAY}",
                     is_ephemeral=True,
                 )
 
@@ -954,26 +1295,30 @@ class ServiceManager(IServiceManager):
                 # 페이지 URL 추출
                 page_url = notion_result.get("url", "https://notion.so")
 
-                # 생성된 페이지 정보를 데이터베이스에 저장
-                try:
-                    await save_notion_page(
-                        page_id=notion_result.get("id", ""),
-                        database_id=settings.board_db_id,
-                        page_type="document",
-                        title=unique_title,
-                        created_by=str(request.user.user_id),
-                        metadata={
-                            "doc_type": doc_type,
-                            "discord_user": request.user.username,
-                        },
-                    )
-                except Exception as save_error:
-                    logger.warning(f"⚠️ 페이지 정보 저장 실패 (계속 진행): {save_error}")
+            # 페이지 정보 저장(MongoDB)과 당일 스레드 조회(Discord)를 동시에 수행
+            save_result, thread_info = await asyncio.gather(
+                save_notion_page(
+                    page_id=notion_result.get("id", ""),
+                    database_id=BOARD_DB_ID,
+                    page_type="document",
+                    title=unique_title,
+                    created_by=str(request.user.user_id),
+                    metadata={
+                        "doc_type": doc_type,
+                        "discord_user": request.user.username,
+                    },
+                ),
+                self._discord_service.get_or_create_daily_thread(
+                    request.channel_id, title=unique_title
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(save_result, Exception):
+                logger.warning(f"⚠️ 페이지 정보 저장 실패 (계속 진행): {save_result}")
+            if isinstance(thread_info, Exception):
+                raise thread_info
 
             # 당일 스레드에 문서 생성 알림 전송
-            thread_info = await self._discord_service.get_or_create_daily_thread(
-                request.channel_id, title=unique_title
-            )
 
             document_notification = (
                 f"📄 **새 문서 생성됨**\n\n"
@@ -1020,7 +1365,7 @@ class ServiceManager(IServiceManager):
             # page_id가 없으면 사용자의 최근 생성 페이지를 가져옴
             if not page_id:
                 logger.info(
-                    f"📖 사용자 {request.user.username}의 최근 페이지 조회 중..."
+                    "📖 사용자 %s의 최근 페이지 조회 중...", request.user.username
                 )
                 recent_page = await get_recent_notion_page_by_user(
                     str(request.user.user_id)
@@ -1037,7 +1382,10 @@ class ServiceManager(IServiceManager):
                 page_title = recent_page.get("title", "제목 없음")
                 page_type = recent_page.get("page_type", "unknown")
                 logger.info(
-                    f"📄 최근 페이지 사용: {page_title} ({page_type}) (ID: {page_id})"
+                    "📄 최근 페이지 사용: %s (%s) (ID: %s)",
+                    page_title,
+                    page_type,
+                    page_id,
                 )
 
             # 1. 기존 Notion 서비스를 통한 페이지 내용 추출
@@ -1048,65 +1396,41 @@ class ServiceManager(IServiceManager):
             if channel_id:
                 # channel_id를 int로 변환 (실제로는 thread_id)
                 thread_id_int = int(channel_id)
+                # 기존에 생성된 스레드 ID로 간주하고 그대로 사용
                 logger.info(
-                    f"🔧 fetch 워크플로우: 전달받은 ID={channel_id} -> {thread_id_int}"
+                    "🔧 fetch 워크플로우: 전달받은 ID=%s -> 기존 스레드 사용 thread_id=%s",
+                    channel_id,
+                    thread_id_int,
                 )
-                logger.info(f"📋 이 ID는 기존에 생성된 스레드 ID로 추정됨")
-
-                # 스레드 정보 구성 (기존 스레드 사용)
-                from types import SimpleNamespace
 
-                thread_info = SimpleNamespace(thread_id=thread_id_int)
-                logger.info(f"✅ 기존 스레드 사용: thread_id={thread_info.thread_id}")
+                if page_text and not page_text.isspace():
+                    # 긴 내용을 설정된 크기로 분할
+                    max_length = settings.discord_message_chunk_size
+                    text_parts = _split_text_by_lines(page_text, max_length)
 
-                if page_text.strip():
-                    # 헤더 메시지 먼저 전송
+                    # 헤더가 첫 조각과 함께 들어가면 합쳐서 전송, 아니면 먼저 따로 전송
                     header_message = (
                         f"📝 **노션 페이지 내용** (페이지 ID: `{page_id}`)\n"
                     )
-                    await self._discord_service.send_thread_message(
-                        thread_info.thread_id, header_message
-                    )
-
-                    # 긴 내용을 설정된 크기로 분할해서 전송
-                    max_length = settings.discord_message_chunk_size
-                    text_parts = []
-
-                    if len(page_text) <= max_length:
-                        text_parts = [page_text]
-                    else:
-                        # 줄 단위로 분할하여 자연스럽게 나누기
-                        lines = page_text.split("\n")
-                        current_part = ""
-
-                        for line in lines:
-                            if len(current_part + line + "\n") <= max_length:
-                                current_part += line + "\n"
-                            else:
-                                if current_part:
-                                    text_parts.append(current_part.rstrip())
-                                current_part = line + "\n"
-
-                        if current_part:
-                            text_parts.append(current_part.rstrip())
-
-                    # 각 부분을 순차적으로 전송
-                    for i, part in enumerate(text_parts):
-                        if len(text_parts) > 1:
-                            part_message = f"**[{i+1}/{len(text_parts)}]**\n{part}"
-                        else:
-                            part_message = part
-
+                    # 첫 조각에 붙는 [1/n] 라벨까지 포함해 길이 확인
+                    first_message = _part_label(0, len(text_parts)) + text_parts[0]
+                    if len(header_message) + len(first_message) > max_length:
                         await self._discord_service.send_thread_message(
-                            thread_info.thread_id, part_message
+                            thread_id_int, header_message
                         )
+                        header_message = ""
+
+                    # 각 부분을 순서대로 전송 (예외는 워크플로우 오류로 전달)
+                    await self._send_thread_parts(
+                        thread_id_int, text_parts, header=header_message
+                    )
                 else:
                     # 빈 페이지 처리
                     empty_message = (
                         "📝 **노션 페이지 내용**\n\n*(페이지 내용이 비어있습니다)*"
                     )
                     await self._discord_service.send_thread_message(
-                        thread_info.thread_id, empty_message
+                        thread_id_int, empty_message
                     )
 
                 # 사용된 페이지 정보 추가
@@ -1123,7 +1447,7 @@ class ServiceManager(IServiceManager):
                 )
             else:
                 # channel_id가 없는 경우, 응답으로 직접 전송 (길이 제한 적용)
-                if page_text.strip():
+                if page_text and not page_text.isspace():
                     formatted_message = f"📝 **노션 페이지 내용**\n\n{page_text}"
 
                     # Discord 응답 길이 제한 (4000자) 처리
@@ -1155,61 +1479,9 @@ class ServiceManager(IServiceManager):
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """명령어 도움말 워크플로우"""
-        help_content = (
-            "🤖 **노션봇 사용 가이드**\n\n"
-            "**📝 태스크 관리**\n"
-            "> `/task person:[담당자] name:[제목] priority:[우선순위]`\n"
-            "> • **담당자**: 소현, 정빈, 동훈 중 선택 (필수)\n"
-            "> • **제목**: 태스크 제목 (필수)\n"
-            "> • **우선순위**: High, Medium, Low 중 선택 (선택사항)\n"
-            "> • **예시**: `/task person:정빈 name:버그수정 priority:High`\n\n"
-            "**📋 회의록 관리**\n"
-            "> `/meeting title:[제목] participants:[참석자]`\n"
-            "> • **제목**: 회의록 제목 (필수)\n"
-            "> • **참석자**: 소현, 정빈, 동훈 중 선택 (필수)\n"
-            "> • **예시**: `/meeting title:주간회의 participants:정빈,소현`\n\n"
-            "**📄 문서 생성**\n"
-            "> `/document title:[제목] doc_type:[문서타입]`\n"
-            "> • **문서타입**: 개발 문서, 기획안, 개발 규칙, 회의록\n"
-            "> • **예시**: `/document title:API설계서 doc_type:개발 문서`\n\n"
-            "**📄 페이지 내용 가져오기**\n"
-            "> `/fetch page_id:[노션페이지ID]`\n"
-            "> • 노션 페이지의 원본 내용을 스레드로 가져옵니다\n"
-            "> • page_id 미입력 시 최근 생성된 페이지 자동 선택\n"
-            "> • **예시**: `/fetch` 또는 `/fetch page_id:abc123def456...`\n\n"
-            "**🔍 페이지 검색**\n"
-            "> `/search query:[키워드] page_type:[타입] user:[사용자] days:[일수]`\n"
-            "> • **타입**: task, meeting, document, all (기본값: all)\n"
-            "> • **연관 검색어, 인기 검색어 자동 제안**\n"
-            "> • **예시**: `/search query:API page_type:document`\n\n"
-            "**📊 통계 조회**\n"
-            "> `/daily_stats [user:사용자]` - 일별 통계 (차트 포함)\n"
-            "> `/weekly_stats [user:사용자]` - 주별 통계 (차트 포함)\n"
-            "> `/monthly_stats [user:사용자]` - 월별 통계 (차트 포함)\n"
-            "> `/user_stats user:사용자` - 사용자별 생산성 통계\n"
-            "> `/team_stats` - 팀 전체 통계 및 협업 분석\n"
-            "> `/trends [days:일수]` - 활동 트렌드 분석 (기본 14일)\n"
-            "> `/task_stats [user:사용자] [status:상태]` - 태스크 완료율 통계\n\n"
-            "**👁️ 페이지 감시**\n"
-            "> `/watch page_id:[노션페이지ID] interval:[간격]`\n"
-            "> • 노션 페이지 변경사항을 주기적으로 확인 (개발 중)\n"
-            "> • **간격**: 분 단위 (기본 30분)\n\n"
-            "**🔧 시스템 정보**\n"
-            "> `/status` - 봇과 시스템 상태 확인\n"
-            "> `/help` - 이 도움말 표시\n\n"
-            "**💡 팁**\n"
-            "> • 모든 알림은 당일 스레드에 자동으로 전송됩니다\n"
-            "> • 페이지 생성 시 페이지 ID가 자동으로 제공됩니다\n"
-            "> • 검색 시 연관 검색어와 인기 검색어가 자동 제안됩니다\n"
-            "> • 통계는 차트 이미지로 시각화되어 제공됩니다\n\n"
-            "**📊 데이터베이스**\n"
-            "> • **Factory Tracker**: 태스크 관리\n"
-            "> • **Board**: 회의록 및 문서 관리"
-        )
-
         return DiscordMessageResponseDTO(
             message_type=MessageType.SUCCESS_NOTIFICATION,
-            content=help_content,
+            content=HELP_CONTENT,
             is_embed=True,
             is_ephemeral=True,
             title="노션봇 명령어 가이드",
@@ -1220,10 +1492,12 @@ class ServiceManager(IServiceManager):
     ) -> DiscordMessageResponseDTO:
         """시스템 상태 확인 워크플로우"""
         try:
-            # 실시간 대시보드 데이터 생성
-            dashboard_data = (
-                await get_mongodb_analysis_service().generate_realtime_dashboard_data()
+            # 대시보드 데이터 조회와 MongoDB ping을 동시에 수행
+            dashboard_data, mongo_ok = await asyncio.gather(
+                _get_cached_dashboard(), _probe_mongodb()
             )
+            discord_service = self.discord_service
+            discord_ok = bool(discord_service and discord_service.is_bot_ready)
 
             # 명령어 통계 요약
             command_stats = dashboard_data.get("command_stats", {})
@@ -1255,8 +1529,8 @@ class ServiceManager(IServiceManager):
                 f"• 스키마 캐시: `{schema_cache_count}개`\n"
                 f"• 스레드 캐시: `{thread_cache_count}개`\n\n"
                 f"⚡ **서비스 상태**\n"
-                f"• MongoDB: `{'✅ 정상' if mongodb_connection.connection_status else '❌ 오류'}`\n"
-                f"• Discord Bot: `{'✅ 정상' if self._discord_service.ready else '❌ 오류'}`\n"
+                f"• MongoDB: `{'✅ 정상' if mongo_ok else '❌ 오류'}`\n"
+                f"• Discord Bot: `{'✅ 정상' if discord_ok else '❌ 오류'}`\n"
                 f"• MCP 시스템: `❌ 비활성`\n"
                 f"• 폴백 횟수: `0회`"
             )
@@ -1291,16 +1565,7 @@ class ServiceManager(IServiceManager):
             base_message += f"💡 **페이지 ID**: `{page_id}`\n"
             base_message += f"📋 **내용 확인**: `/fetch page_id:{page_id}`\n"
 
-        base_message += (
-            f"\n**📋 작성 가이드**\n"
-            f"> • **Agenda**: 회의 주제 및 목표\n"
-            f"> • **Discussion**: 주요 논의 content\n"
-            f"> • **Decisions**: 확정된 결정 사항들\n"
-            f"> • **Action Items**: assignee별 할 일과 due_date\n\n"
-            f"✨ 작성 완료 후 `/fetch` 명령어로 내용을 이 스레드로 가져올 수 있습니다!"
-        )
-
-        return base_message
+        return base_message + MEETING_GUIDE_TAIL
 
     # ===== FastAPI 라우트 설정 =====
 
@@ -1322,19 +1587,26 @@ class ServiceManager(IServiceManager):
         ):
             """노션 웹훅 request 처리"""
             # 웹훅 시크릿 검증
-            if x_webhook_secret != settings.webhook_secret:
+            if not _secret_matches(x_webhook_secret, settings.webhook_secret):
                 logger.warning(
-                    f"🔒 웹훅 인증 실패: {request.client.host if request.client else 'Unknown'}"
+                    "🔒 웹훅 인증 실패: %s",
+                    request.client.host if request.client else "Unknown",
                 )
                 raise HTTPException(
                     status_code=401, detail="Unauthorized webhook secret"
                 )
 
-            start_time = datetime.now()
+            start_time = time.monotonic()
+            raw_body = await _read_body_capped(
+                request, settings.webhook_max_body_bytes
+            )
 
             try:
                 # request 본문 파싱
-                webhook_data = await request.json()
+                if orjson is not None:
+                    webhook_data = orjson.loads(raw_body)
+                else:
+                    webhook_data = json.loads(raw_body)
                 webhook_request = NotionWebhookRequestDTO(
                     page_id=webhook_data.get("page_id"),
                     channel_id=int(
@@ -1354,8 +1626,11 @@ class ServiceManager(IServiceManager):
                 process_result = await self._webhook_summary_workflow(
                     webhook_request, start_time
                 )
+                if process_result.success:
+                    # 페이지가 갱신되었으므로 캐시된 통계 메시지 무효화
+                    _stats_cache.clear()
 
-                return JSONResponse(
+                return APIResponse(
                     {
                         "success": process_result.success,
                         "page_id": process_result.page_id,
@@ -1368,9 +1643,9 @@ class ServiceManager(IServiceManager):
                 )
 
             except Exception as webhook_error:
-                processing_time = (datetime.now() - start_time).total_seconds()
+                processing_time = time.monotonic() - start_time
                 logger.error(f"❌ 웹훅 처리 실패: {webhook_error}")
-                return JSONResponse(
+                return APIResponse(
                     {
                         "success": False,
                         "error": str(webhook_error),
@@ -1383,16 +1658,13 @@ class ServiceManager(IServiceManager):
         async def health_check():
             """서비스 상태 확인 엔드포인트"""
             status_info = await self.check_service_status()
+            # 중첩 DTO들을 서비스별로 따로 덤프하지 않고 한 번의 model_dump로 직렬화
+            dumped = status_info.model_dump(include={"services", "mongodb"})
             return {
                 "status": status_info.status,
                 "uptime_seconds": status_info.uptime_seconds,
-                "services": {
-                    name: service.model_dump()
-                    for name, service in status_info.services.items()
-                },
-                "mongodb": (
-                    status_info.mongodb.model_dump() if status_info.mongodb else None
-                ),
+                "services": dumped["services"],
+                "mongodb": dumped["mongodb"],
                 "mcp": {"mcp_enabled": False, "fallback_count": 0},
             }
 
@@ -1405,12 +1677,9 @@ class ServiceManager(IServiceManager):
         async def realtime_dashboard():
             """실시간 성능 대시보드 데이터"""
             try:
-                dashboard_data = (
-                    await get_mongodb_analysis_service().generate_realtime_dashboard_data()
-                )
-                return dashboard_data
+                return await _get_cached_dashboard()
             except Exception as dashboard_error:
-                return JSONResponse(
+                return APIResponse(
                     {"error": f"대시보드 데이터 생성 실패: {dashboard_error}"},
                     status_code=500,
                 )
@@ -1423,7 +1692,7 @@ class ServiceManager(IServiceManager):
                 status = await sync_service.get_sync_status()
                 return status
             except Exception as sync_error:
-                return JSONResponse(
+                return APIResponse(
                     {"error": f"동기화 상태 조회 실패: {sync_error}"},
                     status_code=500,
                 )
@@ -1436,7 +1705,7 @@ class ServiceManager(IServiceManager):
                 result = await sync_service.manual_sync()
                 return result
             except Exception as sync_error:
-                return JSONResponse(
+                return APIResponse(
                     {"error": f"수동 동기화 실패: {sync_error}"},
                     status_code=500,
                 )
@@ -1449,7 +1718,9 @@ class ServiceManager(IServiceManager):
             x_webhook_secret: str = Header(default=""),
         ):
             """CareerOS에서 발송하는 일일 공고 다이제스트 수신 엔드포인트."""
-            if x_webhook_secret != settings.careeros_webhook_secret:
+            if not _secret_matches(
+                x_webhook_secret, settings.careeros_webhook_secret
+            ):
                 logger.warning("CareerOS digest webhook: invalid secret from %s",
                                request.client.host if request.client else "unknown")
                 raise HTTPException(status_code=401, detail="Unauthorized")
@@ -1484,7 +1755,7 @@ class ServiceManager(IServiceManager):
 
             except Exception as exc:
                 logger.error("CareerOS digest webhook error: %s", exc)
-                return JSONResponse({"success": False, "error": str(exc)}, status_code=500)
+                return APIResponse({"success": False, "error": str(exc)}, status_code=500)
 
         # ── CareerOS MCP tools ────────────────────────────────────────
 
@@ -1624,64 +1895,44 @@ class ServiceManager(IServiceManager):
             )
 
     async def _webhook_summary_workflow(
-        self, request: NotionWebhookRequestDTO, start_time: datetime
+        self, request: NotionWebhookRequestDTO, start_time: float
     ) -> WebhookProcessResultDTO:
         """웹훅 요약 전체 워크플로우"""
         try:
-            # 1. 기존 Notion 서비스를 통한 페이지 내용 추출
+            # 1. 페이지 내용 추출과 스레드 조회/생성을 동시에 수행
             with logger_manager.performance_logger("notion_page_extraction"):
-                page_text = await self._notion_service.extract_page_text(
-                    request.page_id
+                page_text, thread_info = await asyncio.gather(
+                    self._notion_service.extract_page_text(request.page_id),
+                    self._discord_service.get_or_create_daily_thread(
+                        request.channel_id, title="캐시 통계"
+                    ),
+                    return_exceptions=True,
                 )
+            for result in (page_text, thread_info):
+                if isinstance(result, BaseException):
+                    raise Exception(f"WEBHOOK_PROCESSING_ERROR: {result}") from result
 
             # 2. 원본 텍스트를 Discord 메시지 형태로 포맷팅 및 분할
-            thread_info = await self._discord_service.get_or_create_daily_thread(
-                request.channel_id, title="캐시 통계"
-            )
-
-            if page_text.strip():
-                # 헤더 메시지 먼저 전송
-                header_message = "📝 **노션 페이지 내용**\n"
-                await self._discord_service.send_thread_message(
-                    thread_info.thread_id, header_message
-                )
-
-                # 긴 내용을 설정된 크기로 분할해서 전송
+            page_text_len = len(page_text)
+            if page_text_len and not page_text.isspace():
+                # 긴 내용을 설정된 크기로 분할
                 max_length = settings.discord_message_chunk_size
-                text_parts = []
-
-                if len(page_text) <= max_length:
-                    text_parts = [page_text]
-                else:
-                    # 줄 단위로 분할하여 자연스럽게 나누기
-                    lines = page_text.split("\n")
-                    current_part = ""
-
-                    for line in lines:
-                        if len(current_part + line + "\n") <= max_length:
-                            current_part += line + "\n"
-                        else:
-                            if current_part:
-                                text_parts.append(current_part.rstrip())
-                            current_part = line + "\n"
-
-                    if current_part:
-                        text_parts.append(current_part.rstrip())
-
-                # 각 부분을 순차적으로 전송
-                message_send_success = True
-                for i, part in enumerate(text_parts):
-                    if len(text_parts) > 1:
-                        part_message = f"**[{i+1}/{len(text_parts)}]**\n{part}"
-                    else:
-                        part_message = part
+                text_parts = _split_text_by_lines(page_text, max_length)
 
-                    success = await self._discord_service.send_thread_message(
-                        thread_info.thread_id, part_message
+                # 헤더가 첫 조각과 함께 들어가면 합쳐서 전송, 아니면 먼저 따로 전송
+                header_message = "📝 **노션 페이지 내용**\n"
+                # 첫 조각에 붙는 [1/n] 라벨까지 포함해 길이 확인
+                first_message = _part_label(0, len(text_parts)) + text_parts[0]
+                if len(header_message) + len(first_message) > max_length:
+                    await self._discord_service.send_thread_message(
+                        thread_info.thread_id, header_message
                     )
-                    if not success:
-                        message_send_success = False
-                        break
+                    header_message = ""
+
+                # 각 부분을 순서대로 전송 (실패하면 나머지는 보내지 않음)
+                message_send_success = await self._send_thread_parts(
+                    thread_info.thread_id, text_parts, header=header_message
+                )
             else:
                 # 빈 페이지 처리
                 empty_message = (
@@ -1695,20 +1946,22 @@ class ServiceManager(IServiceManager):
                 raise Exception("디스코드 메시지 전송 실패")
 
             # 4. 처리 결과 생성
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.monotonic() - start_time
 
             return WebhookProcessResultDTO(
                 success=True,
                 page_id=request.page_id,
-                extracted_text=page_text[:500],  # 처음 500자만 저장
-                text_length=len(page_text),
+                extracted_text=(  # 처음 500자만 저장
+                    page_text[:500] if page_text_len > 500 else page_text
+                ),
+                text_length=page_text_len,
                 discord_message_sent=True,
                 thread_id=thread_info.thread_id,
                 processing_time_ms=processing_time * 1000,  # 초를 밀리초로 변환
             )
 
         except Exception as workflow_error:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.monotonic() - start_time
             logger.error(f"❌ 웹훅 요약 워크플로우 실패: {workflow_error}")
 
             return WebhookProcessResultDTO(
@@ -1722,6 +1975,23 @@ class ServiceManager(IServiceManager):
                 processing_time_ms=processing_time * 1000,  # 초를 밀리초로 변환
             )
 
+    async def _send_thread_parts(
+        self, thread_id: int, text_parts: List[str], header: str = ""
+    ) -> bool:
+        """분할된 메시지를 순서대로 스레드에 전송 (header는 첫 조각 앞에 붙임, 실패 시 중단)"""
+        discord_service = self.discord_service
+        total_parts = len(text_parts)
+        for index, part in enumerate(text_parts):
+            part = _part_label(index, total_parts) + part
+            if index == 0:
+                part = header + part
+            # 같은 스레드는 순서 유지를 위해 순차 전송, 세마포어는 전체 동시 전송 상한
+            async with self._discord_send_sem:
+                sent = await discord_service.send_thread_message(thread_id, part)
+            if not sent:
+                return False
+        return True
+
     def _setup_exception_handlers(self):
         """FastAPI 글로벌 예외 핸들러 설정"""
 
@@ -1733,38 +2003,88 @@ class ServiceManager(IServiceManager):
     async def _start_auto_tasks(self):
         """백그라운드 자동 작업들을 시작"""
         # 일일 데이터 정리 작업 (매일 새벽 2시)
-        daily_cleanup_task = asyncio.create_task(self._daily_cleanup_scheduler())
-        self.auto_tasks.append(daily_cleanup_task)
+        self._spawn_auto_task(self._daily_cleanup_scheduler(), "daily_cleanup")
 
         # 주간 백업 작업 (매주 일요일 새벽 3시)
-        weekly_backup_task = asyncio.create_task(self._weekly_backup_scheduler())
-        self.auto_tasks.append(weekly_backup_task)
+        self._spawn_auto_task(self._weekly_backup_scheduler(), "weekly_backup")
+
+        # 통계 스냅샷 주기적 갱신
+        self._spawn_auto_task(self._stats_refresher(), "stats_refresher")
 
         # 백그라운드 자동 작업 시작 완료 (로그 제거)
 
+    def _spawn_auto_task(self, coro, name: str) -> Optional[asyncio.Task]:
+        """백그라운드 작업 생성 (동시 실행 개수 제한, 실패 시 루프 예외 처리기로 보고)"""
+        if len(self.auto_tasks) >= AUTO_TASK_LIMIT:
+            logger.warning(f"⚠️ 백그라운드 작업 한도 초과로 '{name}' 작업을 건너뜁니다")
+            coro.close()
+            return None
+
+        task = asyncio.create_task(coro, name=name)
+        self.auto_tasks.append(task)
+        task.add_done_callback(self._on_auto_task_done)
+        return task
+
+    def _on_auto_task_done(self, task: asyncio.Task):
+        """완료된 백그라운드 작업 정리 및 예외 보고"""
+        if task in self.auto_tasks:
+            self.auto_tasks.remove(task)
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            task.get_loop().call_exception_handler(
+                {
+                    "message": f"백그라운드 작업 '{task.get_name()}' 실패",
+                    "exception": error,
+                    "task": task,
+                }
+            )
+
+    async def _close_auto_tasks(self):
+        """실행 중인 백그라운드 작업을 모두 취소하고 종료 대기"""
+        if not self.auto_tasks:
+            return
+
+        logger.info("⏹️ 백그라운드 작업들 종료 중...")
+        tasks = list(self.auto_tasks)
+        for task in tasks:
+            task.cancel()
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            pass  # 취소된 작업들은 정상
+
     async def _daily_cleanup_scheduler(self):
         """일일 데이터 정리 스케줄러"""
+        # 다음 실행 시각을 절대 시각으로 유지해 실행 시간만큼 일정이 밀리지 않도록 함
+        next_run = _next_run_at(self._now(), hour=2)
         while True:
             try:
-                # 24시간마다 실행
-                await asyncio.sleep(24 * 60 * 60)
+                # 매일 새벽 2시
+                await asyncio.sleep(max(0.0, (next_run - self._now()).total_seconds()))
                 await daily_auto_cleanup_task()
             except asyncio.CancelledError:
                 break
             except Exception as cleanup_error:
                 logger.error(f"❌ 일일 정리 스케줄러 오류: {cleanup_error}")
+            next_run = _next_run_at(max(self._now(), next_run), hour=2)
 
     async def _weekly_backup_scheduler(self):
         """주간 백업 스케줄러"""
+        # 다음 실행 시각을 절대 시각으로 유지해 실행 시간만큼 일정이 밀리지 않도록 함
+        next_run = _next_run_at(self._now(), hour=3, weekday=6)
         while True:
             try:
-                # 7일마다 실행
-                await asyncio.sleep(7 * 24 * 60 * 60)
+                # 매주 일요일 새벽 3시
+                await asyncio.sleep(max(0.0, (next_run - self._now()).total_seconds()))
                 await weekly_backup_task()
             except asyncio.CancelledError:
                 break
             except Exception as backup_error:
                 logger.error(f"❌ 주간 백업 스케줄러 오류: {backup_error}")
+            next_run = _next_run_at(max(self._now(), next_run), hour=3, weekday=6)
 
     async def run_service(self):
         """Discord 봇과 FastAPI server를 동시에 실행"""
@@ -1777,6 +2097,8 @@ class ServiceManager(IServiceManager):
                 )
 
             # FastAPI server 실행 (메인 스레드)
+            # serve()는 현재 루프(run_main에서 uvloop 정책 적용)에서 돌기 때문에 loop 옵션은 무의미,
+            # http 파서는 기본값 auto로 httptools 설치 시 자동 선택됨
             config = uvicorn.Config(
                 app=self.web_application,
                 host=settings.host,
@@ -1784,6 +2106,7 @@ class ServiceManager(IServiceManager):
                 log_config=None,  # 우리의 logger 시스템 사용
                 log_level="warning",  # uvicorn 로그 레벨을 warning으로 설정
                 access_log=False,  # 액세스 로그 비활성화 (너무 많은 로그 방지)
+                limit_concurrency=settings.web_limit_concurrency,  # 버스트 시 503으로 빠르게 거절
             )
             server = uvicorn.Server(config)
 
@@ -1821,6 +2144,74 @@ class ServiceManager(IServiceManager):
 
     # ===== 통계 관련 워크플로우들 =====
 
+    def _single_flight(
+        self, key: Any, factory: Callable[[], Awaitable[Any]]
+    ) -> Awaitable[Any]:
+        """같은 key로 동시에 들어온 요청은 하나의 실행 결과를 공유 (호출자 취소는 공유 작업에 전파 안 됨)"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._on_flight_done, key))
+        return asyncio.shield(task)
+
+    def _on_flight_done(self, key: Any, task: asyncio.Task):
+        """완료된 공유 작업 제거 (대기자가 모두 빠진 경우를 위해 예외도 회수)"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_stats_message(self, name: str, days: int) -> str:
+        """분석 서비스로 통계 메시지를 생성해 스냅샷 캐시에 저장"""
+        method_name, stats_type, label = STATS_SOURCES[name]
+        analytics_service = self._service_manager.get_service("analytics")
+        result = await analytics_service.get_stats_result(
+            getattr(analytics_service, method_name), days, stats_type=stats_type
+        )
+        if not result.success:
+            raise Exception(f"{label} 생성 실패: {result.error}")
+
+        message = result.message
+        cache_key = (name, days)
+        _stats_cache.pop(cache_key, None)
+        if len(_stats_cache) >= STATS_CACHE_MAX_SIZE:
+            _stats_cache.pop(next(iter(_stats_cache)))
+        _stats_cache[cache_key] = (time.monotonic(), message)
+        return message
+
+    async def _cached_stats_message(self, name: str, days: int) -> str:
+        """스냅샷이 유효하면 바로 반환하고, 없거나 만료되었으면 직접 집계"""
+        cached = _stats_cache.get((name, days))
+        ttl = settings.stats_cache_ttl
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            logger.debug("📦 통계 스냅샷 사용: %s (%s일)", name, days)
+            return cached[1]
+        return await self._single_flight(
+            ("stats", name, days), lambda: self._fetch_stats_message(name, days)
+        )
+
+    async def _stats_refresher(self):
+        """자주 쓰는 통계 스냅샷을 주기적으로 미리 갱신 (DB 부하 분산을 위해 순차 실행)"""
+        while True:
+            try:
+                await asyncio.sleep(settings.stats_refresh_interval)
+                # 기본 기간만 갱신 (사용자가 요청한 임의 기간은 TTL로 만료)
+                for name in STATS_SOURCES:
+                    for days in STATS_REFRESH_DAYS:
+                        await self._refresh_stats_snapshot(name, days)
+            except asyncio.CancelledError:
+                break
+
+    async def _refresh_stats_snapshot(self, name: str, days: int):
+        """통계 스냅샷 하나를 갱신 (실패는 경고만 남김)"""
+        try:
+            await self._fetch_stats_message(name, days)
+        except Exception as refresh_error:
+            logger.warning(
+                "⚠️ 통계 스냅샷 갱신 실패 (%s, %s일): %s", name, days, refresh_error
+            )
+
     async def _daily_stats_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
@@ -1881,27 +2272,21 @@ class ServiceManager(IServiceManager):
             else:
                 # 기존 분석 서비스를 통한 텍스트 통계 생성
                 analytics_service = self._service_manager.get_service("analytics")
-                result = await analytics_service.get_daily_stats(target_date)
-
-                if result.get("success"):
-                    stats = result.get("stats", {})
-                    message = result.get("message", "")
-                else:
-                    raise Exception(f"통계 생성 실패: {result.get('error')}")
+                result = await analytics_service.get_stats_result(
+                    analytics_service.get_daily_stats, target_date, stats_type="daily"
+                )
+                if not result.success:
+                    raise Exception(f"통계 생성 실패: {result.error}")
 
                 return DiscordMessageResponseDTO(
                     message_type=MessageType.COMMAND_RESPONSE,
-                    content=message,
+                    content=result.message,
                     is_ephemeral=True,
                 )
 
         except Exception as e:
             logger.error(f"❌ 일별 통계 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return STATS_ERROR_RESPONSE
 
     async def _weekly_stats_workflow(
         self, request: DiscordCommandRequestDTO
@@ -1910,27 +2295,21 @@ class ServiceManager(IServiceManager):
         try:
             # 기존 분석 서비스를 통한 주별 통계 생성
             analytics_service = self._service_manager.get_service("analytics")
-            result = await analytics_service.get_weekly_stats()
-
-            if result.get("success"):
-                stats = result.get("stats", {})
-                message = result.get("message", "")
-            else:
-                raise Exception(f"주별 통계 생성 실패: {result.get('error')}")
+            result = await analytics_service.get_stats_result(
+                analytics_service.get_weekly_stats, stats_type="weekly"
+            )
+            if not result.success:
+                raise Exception(f"주별 통계 생성 실패: {result.error}")
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
-                content=message,
+                content=result.message,
                 is_ephemeral=True,
             )
 
         except Exception as e:
             logger.error(f"❌ 주별 통계 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return STATS_ERROR_RESPONSE
 
     async def _monthly_stats_workflow(
         self, request: DiscordCommandRequestDTO
@@ -1942,76 +2321,60 @@ class ServiceManager(IServiceManager):
 
             # 기존 분석 서비스를 통한 월별 통계 생성
             analytics_service = self._service_manager.get_service("analytics")
-            result = await analytics_service.get_monthly_stats(year, month)
-
-            if result.get("success"):
-                stats = result.get("stats", {})
-                message = result.get("message", "")
-            else:
-                raise Exception(f"월별 통계 생성 실패: {result.get('error')}")
+            result = await analytics_service.get_stats_result(
+                analytics_service.get_monthly_stats, year, month, stats_type="monthly"
+            )
+            if not result.success:
+                raise Exception(f"월별 통계 생성 실패: {result.error}")
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
-                content=message,
+                content=result.message,
                 is_ephemeral=True,
             )
 
         except Exception as e:
             logger.error(f"❌ 월별 통계 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return STATS_ERROR_RESPONSE
 
     async def _user_stats_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """개인 통계 워크플로우"""
         try:
-            days = request.parameters.get("days", 30)
+            days = request.typed_params.days_or(30)
             user_id = str(request.user.user_id)
 
             # 기존 분석 서비스를 통한 사용자 생산성 통계 생성
             analytics_service = self._service_manager.get_service("analytics")
-            result = await analytics_service.get_user_productivity_stats(user_id, days)
-
-            if result.get("success"):
-                stats = result.get("stats", {})
-                message = result.get("message", "")
-            else:
-                raise Exception(f"사용자 생산성 통계 생성 실패: {result.get('error')}")
+            result = await analytics_service.get_stats_result(
+                analytics_service.get_user_productivity_stats,
+                user_id,
+                days,
+                stats_type="user",
+            )
+            if not result.success:
+                raise Exception(f"사용자 생산성 통계 생성 실패: {result.error}")
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
-                content=message,
+                content=result.message,
                 is_ephemeral=True,
             )
 
         except Exception as e:
             logger.error(f"❌ 개인 통계 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return STATS_ERROR_RESPONSE
 
     async def _team_stats_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """팀 통계 워크플로우"""
         try:
-            days = request.parameters.get("days", 30)
+            days = request.typed_params.days_or(30)
 
             # 기존 분석 서비스를 통한 팀 비교 통계 생성
-            analytics_service = self._service_manager.get_service("analytics")
-            result = await analytics_service.get_team_comparison_stats(days)
-
-            if result.get("success"):
-                stats = result.get("stats", {})
-                message = result.get("message", "")
-            else:
-                raise Exception(f"팀 비교 통계 생성 실패: {result.get('error')}")
+            message = await self._cached_stats_message("team_stats", days)
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
@@ -2021,28 +2384,17 @@ class ServiceManager(IServiceManager):
 
         except Exception as e:
             logger.error(f"❌ 팀 통계 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return STATS_ERROR_RESPONSE
 
     async def _trends_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """트렌드 통계 워크플로우"""
         try:
-            days = request.parameters.get("days", 14)
+            days = request.typed_params.days_or(14)
 
             # 기존 분석 서비스를 통한 활동 트렌드 통계 생성
-            analytics_service = self._service_manager.get_service("analytics")
-            result = await analytics_service.get_activity_trends_stats(days)
-
-            if result.get("success"):
-                stats = result.get("stats", {})
-                message = result.get("message", "")
-            else:
-                raise Exception(f"활동 트렌드 통계 생성 실패: {result.get('error')}")
+            message = await self._cached_stats_message("trends", days)
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
@@ -2052,28 +2404,17 @@ class ServiceManager(IServiceManager):
 
         except Exception as e:
             logger.error(f"❌ 트렌드 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return STATS_ERROR_RESPONSE
 
     async def _task_stats_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """Task 완료 통계 워크플로우"""
         try:
-            days = request.parameters.get("days", 30)
+            days = request.typed_params.days_or(30)
 
             # 기존 분석 서비스를 통한 태스크 완료 통계 생성
-            analytics_service = self._service_manager.get_service("analytics")
-            result = await analytics_service.get_task_completion_stats(days)
-
-            if result.get("success"):
-                stats = result.get("stats", {})
-                message = result.get("message", "")
-            else:
-                raise Exception(f"태스크 완료 통계 생성 실패: {result.get('error')}")
+            message = await self._cached_stats_message("task_stats", days)
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
@@ -2083,43 +2424,36 @@ class ServiceManager(IServiceManager):
 
         except Exception as e:
             logger.error(f"❌ Task 통계 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ Task 통계 조회 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return TASK_STATS_ERROR_RESPONSE
 
     async def _search_workflow(
         self, request: DiscordCommandRequestDTO
     ) -> DiscordMessageResponseDTO:
         """검색 워크플로우"""
         try:
-            query = request.parameters.get("query")
-            page_type = request.parameters.get("page_type")
-            user_filter = request.parameters.get("user_filter")
-            days = request.parameters.get("days", 90)
+            params = request.typed_params
+            query = params.query
+            page_type = params.page_type
+            user_filter = params.user_filter
+            days = params.days_or(90)
 
-            if not query or len(query.strip()) < 2:
-                return DiscordMessageResponseDTO(
-                    message_type=MessageType.ERROR_NOTIFICATION,
-                    content="❌ 검색어는 2글자 이상 입력해주세요.",
-                    is_ephemeral=True,
-                )
+            if not params.has_search_query:
+                return SEARCH_QUERY_TOO_SHORT_RESPONSE
 
-            # 기존 검색 서비스를 통한 검색 실행
+            # 기존 검색 서비스를 통한 검색 실행 (동일 조건 동시 검색은 한 번만 실행)
             search_service = self._service_manager.get_service("search")
-            result = await search_service.search_pages(
-                query=query,
-                page_type=page_type or "both",
-                user_filter=user_filter,
-                days=days,
+            result = await self._single_flight(
+                ("search", query, page_type, user_filter, days),
+                lambda: search_service.search_pages(
+                    query=query,
+                    page_type=page_type or "both",
+                    user_filter=user_filter,
+                    days=days,
+                ),
             )
 
-            if result.get("success"):
-                search_results = result.get("results", [])
-                message = search_service.format_search_results(search_results)
-            else:
-                raise Exception(f"검색 실패: {result.get('error')}")
+            # 검색 실패는 search_pages가 예외로 전달 (결과 몇 개 포맷팅은 루프에서 바로 수행)
+            message = search_service.format_search_results(result)
 
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
@@ -2129,11 +2463,7 @@ class ServiceManager(IServiceManager):
 
         except Exception as e:
             logger.error(f"❌ 검색 워크플로우 실패: {e}")
-            return DiscordMessageResponseDTO(
-                message_type=MessageType.ERROR_NOTIFICATION,
-                content="❌ 검색 중 오류가 발생했습니다.",
-                is_ephemeral=True,
-            )
+            return SEARCH_ERROR_RESPONSE
 
     async def _update_task_workflow(
         self, request: DiscordCommandRequestDTO
@@ -2365,6 +2695,38 @@ class ServiceManager(IServiceManager):
                 is_ephemeral=True,
             )
 
+    async def _wait_for_initial_sync(self, timeout: float = 30):
+        """동기화 서비스의 첫 동기화 완료 이벤트 대기 (타임아웃 시 기능 축소 상태로 계속)"""
+        try:
+            sync_service = self._service_manager.get_service("sync")
+        except (KeyError, RuntimeError):
+            return
+        if not sync_service.is_synchronization_running:
+            return
+
+        try:
+            await asyncio.wait_for(
+                sync_service.initial_sync_complete.wait(), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ 초기 동기화가 {timeout}초 내에 완료되지 않았습니다")
+            await log_system_event(
+                event_type="initial_sync_timeout",
+                description=f"초기 동기화 대기 시간 초과 ({timeout}초), 계속 진행",
+                severity="warning",
+            )
+
+    async def _initialize_collections(self):
+        """DinoBot 서비스 컬렉션 초기화 및 결과 로깅"""
+        collection_result = await initialize_meetup_loader_collections()
+
+        await log_system_event(
+            event_type="collections_initialized",
+            description=f"컬렉션 초기화 완료: {collection_result['total_collections']}개 (신규: {len(collection_result['created_collections'])}개)",
+            severity="info",
+            metadata=collection_result,
+        )
+
     async def _initialize_full_services(self):
         """전체 서비스 초기화 (설정 완료 시)"""
         try:
@@ -2396,6 +2758,7 @@ class ServiceManager(IServiceManager):
                 port=settings.port,
                 log_level="warning",
                 access_log=False,
+                limit_concurrency=settings.web_limit_concurrency,
             )
             server = uvicorn.Server(config)
 
@@ -2457,16 +2820,19 @@ app = ServiceManager()
 
 async def main():
     """메인 진입점"""
-    # 로깅 시스템 초기화
+    # 로깅 시스템 초기화 (이후 단계의 로그가 유실되지 않도록 가장 먼저 실행)
     initialize_logging_system("INFO")
 
     # 메트릭 수집기 초기화
     metrics_collector = get_metrics_collector()
-    metrics_collector.start_metrics_server(port=9090)
 
     # 전역 애플리케이션 인스턴스 사용
     try:
-        await app.initialize_system()
+        # 메트릭 서버 기동(소켓 바인딩)은 스레드에서 서비스 초기화와 동시에 진행
+        await asyncio.gather(
+            asyncio.to_thread(metrics_collector.start_metrics_server, port=9090),
+            app.initialize_system(),
+        )
         await app.run_service()
     except KeyboardInterrupt:
         logger.info("⌨️ 사용자 중단 request")
@@ -2475,8 +2841,17 @@ async def main():
         raise
     finally:
         await app.shutdown_system()
+        metrics_collector.shutdown()
+        logger_manager.shutdown()
+
+
+def run_main():
+    """이벤트 루프 정책 설정 후 main 실행 (uvloop 설치 시 uvloop 사용)"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main())
 
 
 if __name__ == "__main__":
     # 프로그램 시작점
-    asyncio.run(main())
+    run_main()
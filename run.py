@@ -4,18 +4,17 @@ DinoBot - Discord Notion Integration Bot
 Main entry point for the application
 """
 
-import asyncio
 import sys
 import os
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from main import main
+from main import run_main
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main()
     except KeyboardInterrupt:
         print("\n🛑 DinoBot 서비스 종료 중...")
         sys.exit(0)
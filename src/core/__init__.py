@@ -8,7 +8,7 @@ This module contains the essential infrastructure components:
 - Service lifecycle management
 """
 
-from .config import Settings, settings
+from .config import Settings, settings, get_settings
 from .database import MongoDBConnectionManager, mongodb_connection
 from .logger import initialize_logging_system, get_logger, logger_manager
 from .service_manager import ServiceManager
@@ -17,6 +17,7 @@ __all__ = [
     # Configuration
     'Settings',
     'settings',
+    'get_settings',
     
     # Database
     'MongoDBConnectionManager',
@@ -1,9 +1,11 @@
 """Configuration settings for DinoBot."""
 
 import os
+from functools import lru_cache
 from typing import Optional, Any
-from zoneinfo import ZoneInfo
-from pydantic_settings import BaseSettings
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import PrivateAttr, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -42,21 +44,30 @@ class Settings(BaseSettings):
     # MongoDB settings
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "dinobot"
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 10  # pre-warmed connections
+    mongo_max_idle_time_ms: int = 300_000  # 5 minutes
+    mongo_max_connecting: int = 2  # avoid connection storms on restart
 
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8889
+    web_limit_concurrency: Optional[int] = 200  # max in-flight HTTP requests
     timezone: str = "Asia/Seoul"
 
     # Security settings
     webhook_secret: str = "my-notion-webhook-secret"
+    webhook_max_body_bytes: int = 64 * 1024  # reject larger webhook bodies (413)
 
     # Caching settings
     schema_cache_ttl: int = 3600  # 1 hour in seconds
     page_content_cache_ttl: int = 600  # 10 minutes in seconds
+    stats_cache_ttl: int = 3600  # analytics stats message cache (1 hour)
+    stats_refresh_interval: int = 600  # background stats snapshot refresh (10 minutes)
 
     # Performance settings
     discord_message_chunk_size: int = 1800  # Discord message split size
+    discord_send_concurrency: int = 4  # max in-flight thread sends (5/5s bucket)
     sync_recent_threshold: int = 1800  # 30 minutes in seconds
     cleanup_interval: int = 3600  # 1 hour in seconds
     auto_archive_duration: int = 1440  # 24 hours in minutes
@@ -81,6 +92,35 @@ class Settings(BaseSettings):
     telegram_bot_token: str = ""
     telegram_chat_id: str = ""
 
+    # (timezone 문자열, ZoneInfo) 캐시 - tz 접근 시 재생성 방지
+    _tz_cache: Optional[tuple] = PrivateAttr(default=None)
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
+    @field_validator("mongodb_url", mode="after")
+    @classmethod
+    def _validate_mongodb_url(cls, value: str) -> str:
+        """MongoDB 연결 URL 스킴 확인"""
+        if not value.startswith(("mongodb://", "mongodb+srv://")):
+            raise ValueError("mongodb_url must start with mongodb:// or mongodb+srv://")
+        return value
+
+    @field_validator("timezone", mode="after")
+    @classmethod
+    def _validate_timezone(cls, value: str) -> str:
+        """IANA 타임존 이름 확인"""
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError) as zone_error:
+            raise ValueError(f"unknown timezone: {value}") from zone_error
+        return value
+
+    @model_validator(mode="after")
+    def _cache_timezone(self) -> "Settings":
+        """검증된 timezone의 ZoneInfo를 미리 캐싱 (tz 접근은 캐시 조회만 수행)"""
+        self._tz_cache = (self.timezone, ZoneInfo(self.timezone))
+        return self
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # 설정 관리자와 동기화
@@ -111,15 +151,22 @@ class Settings(BaseSettings):
             return config_manager.set(key, value, "settings_sync")
         return False
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-
     @property
     def tz(self) -> ZoneInfo:
         """Get timezone object."""
-        return ZoneInfo(self.timezone)
+        cached = self._tz_cache
+        if cached is not None and cached[0] == self.timezone:
+            return cached[1]
+        zone = ZoneInfo(self.timezone)
+        self._tz_cache = (self.timezone, zone)
+        return zone
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Settings 싱글턴 반환 (환경변수 파싱/검증은 프로세스당 한 번만 수행)"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -9,8 +9,12 @@ MongoDB 데이터베이스 연결 및 운영 관리 모듈
 - 인덱스 자동 생성 및 관리
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+import time
 from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
     AsyncIOMotorDatabase,
@@ -57,7 +61,13 @@ class MongoDBConnectionManager:
         """
         try:
             # Motor 클라이언트로 비동기 MongoDB 연결 생성
-            self.mongo_client = AsyncIOMotorClient(settings.mongodb_url)
+            self.mongo_client = AsyncIOMotorClient(
+                settings.mongodb_url,
+                maxPoolSize=settings.mongo_max_pool_size,
+                minPoolSize=settings.mongo_min_pool_size,
+                maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+                maxConnecting=settings.mongo_max_connecting,
+            )
             self.main_database = self.mongo_client[settings.mongodb_db_name]
 
             # 연결 테스트: admin 데이터베이스에 ping 명령 전송
@@ -358,7 +368,7 @@ class NotionSchemaCacheManager:
     캐싱 전략:
     - TTL 기반 만료 (기본 1시간)
     - 스키마 변경 시 즉시 무효화
-    - 메모리 + MongoDB 이중 캐싱 (향후 확장 가능)
+    - 메모리 + MongoDB 이중 캐싱 (프로세스 내 메모리 캐시 우선)
 
     성능 효과:
     - 노션 API 호출 90% 이상 감소
@@ -367,8 +377,20 @@ class NotionSchemaCacheManager:
 
     def __init__(self, mongodb_connection: MongoDBConnectionManager):
         self.mongodb = mongodb_connection
-        # 향후 메모리 캐시 추가 가능한 구조
-        self.memory_cache = {}
+        # db_id -> (저장 시각[time.monotonic()], 스키마)
+        self.memory_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _get_memory_schema(self, notion_db_id: str) -> Optional[Dict[str, Any]]:
+        """메모리 캐시에서 만료되지 않은 스키마 조회"""
+        cached = self.memory_cache.get(notion_db_id)
+        if cached is None:
+            return None
+
+        cached_at, schema = cached
+        if time.monotonic() - cached_at >= settings.schema_cache_ttl:
+            self.memory_cache.pop(notion_db_id, None)
+            return None
+        return schema
 
     async def get_schema(self, notion_db_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -380,6 +402,11 @@ class NotionSchemaCacheManager:
         Returns:
             Optional[Dict]: 스키마 정보 또는 None (캐시 없음/만료됨)
         """
+        # 메모리 캐시 우선 조회 (네트워크 왕복 없음)
+        memory_schema = self._get_memory_schema(notion_db_id)
+        if memory_schema is not None:
+            return memory_schema
+
         try:
             # MongoDB에서 캐시 문서 조회
             cache_document = await self.mongodb.schema_cache_collection.find_one(
@@ -405,6 +432,12 @@ class NotionSchemaCacheManager:
                 return None
 
             logger.debug(f"✅ 스키마 캐시 히트: {notion_db_id}")
+            # 남은 TTL만큼만 메모리에 유지
+            elapsed = (current_time - cache_document["created_at"]).total_seconds()
+            self.memory_cache[notion_db_id] = (
+                time.monotonic() - elapsed,
+                cache_document["schema"],
+            )
             return cache_document["schema"]
 
         except Exception as lookup_error:
@@ -419,6 +452,8 @@ class NotionSchemaCacheManager:
             notion_db_id: 노션 데이터베이스 고유 ID
             schema_data: 캐싱할 스키마 정보
         """
+        self.memory_cache[notion_db_id] = (time.monotonic(), schema_data)
+
         try:
             current_time = datetime.utcnow()
             cache_document = {
@@ -453,6 +488,8 @@ class NotionSchemaCacheManager:
         Args:
             notion_db_id: 무효화할 데이터베이스 ID
         """
+        self.memory_cache.pop(notion_db_id, None)
+
         try:
             delete_result = await self.mongodb.schema_cache_collection.delete_one(
                 {"db_id": notion_db_id}
@@ -622,6 +659,11 @@ class DiscordThreadCacheManager:
             logger.error(f"❌ 스레드 캐시 정리 실패: {cleanup_error}")
 
 
+# 메트릭 문서 배치 저장 설정 (큐가 가득 차면 가장 오래된 문서부터 버림)
+METRICS_QUEUE_MAX_SIZE = 10_000
+METRICS_BATCH_SIZE = 256
+
+
 class PerformanceMetricsCollector:
     """
     애플리케이션 성능 및 사용 통계를 수집하여 모니터링 데이터 제공
@@ -631,10 +673,67 @@ class PerformanceMetricsCollector:
     - 웹훅 호출 통계
     - 에러 발생 빈도
     - 응답 시간 메트릭
+
+    기록은 큐에 추가만 하고, 워커가 최대 METRICS_BATCH_SIZE개씩 insert_many로 저장
+    (워커가 실행 중이 아니면 insert_one으로 바로 저장)
     """
 
     def __init__(self, mongodb_connection: MongoDBConnectionManager):
         self.mongodb = mongodb_connection
+        self._queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(
+            maxsize=METRICS_QUEUE_MAX_SIZE
+        )
+        self._worker_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker_task is not None and not self._worker_task.done()
+
+    def start(self):
+        """배치 저장 워커 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if not self.is_running:
+            self._worker_task = asyncio.create_task(
+                self._run(), name="metrics_drainer"
+            )
+
+    async def stop(self):
+        """남은 메트릭을 모두 저장한 뒤 워커 종료"""
+        if not self.is_running:
+            return
+        await self._queue.put(None)
+        await self._worker_task
+        self._worker_task = None
+
+    async def _record(self, metric_document: Dict[str, Any]):
+        """메트릭 문서를 큐에 추가 (워커가 없으면 바로 저장)"""
+        if not self.is_running:
+            await self.mongodb.metrics_collection.insert_one(metric_document)
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            logger.warning("⚠️ 메트릭 큐가 가득 차 가장 오래된 항목을 버립니다")
+        self._queue.put_nowait(metric_document)
+
+    async def _run(self):
+        """큐에 쌓인 메트릭을 배치 단위로 저장"""
+        stopping = False
+        while not stopping:
+            document = await self._queue.get()
+            if document is None:
+                break
+
+            batch = [document]
+            while len(batch) < METRICS_BATCH_SIZE and not self._queue.empty():
+                document = self._queue.get_nowait()
+                if document is None:
+                    stopping = True
+                    break
+                batch.append(document)
+
+            try:
+                await self.mongodb.metrics_collection.insert_many(batch, ordered=False)
+            except Exception as e:
+                logger.error(f"❌ 메트릭 배치 저장 실패 ({len(batch)}개): {e}")
 
     async def record_command_usage(
         self,
@@ -665,7 +764,7 @@ class PerformanceMetricsCollector:
                 "timestamp": datetime.utcnow(),
             }
 
-            await self.mongodb.metrics_collection.insert_one(metric_document)
+            await self._record(metric_document)
             logger.debug(
                 f"📊 명령어 사용 기록: {command_name} ({'성공' if success else '실패'})"
             )
@@ -699,7 +798,7 @@ class PerformanceMetricsCollector:
                 "timestamp": datetime.utcnow(),
             }
 
-            await self.mongodb.metrics_collection.insert_one(metric_document)
+            await self._record(metric_document)
             logger.debug(
                 f"📈 웹훅 호출 기록: {page_id} ({'성공' if success else '실패'})"
             )
@@ -727,7 +826,7 @@ class PerformanceMetricsCollector:
                 "timestamp": datetime.utcnow(),
             }
 
-            await self.mongodb.metrics_collection.insert_one(metric_document)
+            await self._record(metric_document)
 
         except Exception as record_error:
             logger.error(f"❌ 에러 발생 기록 실패: {record_error}")
@@ -788,11 +887,113 @@ class PerformanceMetricsCollector:
             return {"error": str(lookup_error)}
 
 
+# 배치 대기 항목: (저장할 문서, 저장 완료 Future)
+_PendingPage = Tuple[Dict[str, Any], asyncio.Future]
+
+
+class NotionPageBatcher:
+    """
+    notion_pages 삽입을 모아서 insert_many 한 번으로 저장
+
+    - 대기 시간 없이 이미 큐에 쌓인 문서만 모아 flush (최대 max_batch_size개)
+      혼자 저장하면 바로 insert, flush 중 도착한 문서는 다음 배치로 묶임
+    - submit은 문서별 Future를 반환하며, flush 결과(성공/실패)로 완료됨
+    - 워커가 실행 중이 아니면 호출자가 직접 insert_one으로 저장
+    """
+
+    def __init__(
+        self,
+        mongodb_connection: MongoDBConnectionManager,
+        max_batch_size: int = 100,
+    ):
+        self.mongodb = mongodb_connection
+        self.max_batch_size = max_batch_size
+        self._queue: "asyncio.Queue[Optional[_PendingPage]]" = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker_task is not None and not self._worker_task.done()
+
+    def start(self):
+        """배치 워커 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if not self.is_running:
+            self._worker_task = asyncio.create_task(
+                self._run(), name="notion_page_batcher"
+            )
+
+    async def stop(self):
+        """남은 문서를 모두 저장한 뒤 워커 종료"""
+        if not self.is_running:
+            return
+        await self._queue.put(None)
+        await self._worker_task
+        self._worker_task = None
+
+    def submit(self, document: Dict[str, Any]) -> asyncio.Future:
+        """저장할 문서를 큐에 추가 (반환된 Future는 실제 저장 후 완료)"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((document, future))
+        return future
+
+    async def _run(self):
+        """큐에 쌓인 문서를 모아 flush (같은 틱에 제출된 문서까지만 기다림)"""
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            # 같은 이벤트 루프 틱에 준비된 다른 저장 요청이 제출될 기회를 한 번 줌
+            await asyncio.sleep(0)
+            batch = [item]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[_PendingPage]):
+        """배치를 insert_many로 저장하고 문서별 Future에 결과 전달"""
+        documents = [document for document, _ in batch]
+        # 배치 인덱스 -> 예외 (실패한 문서만)
+        failures: Dict[int, Exception] = {}
+        try:
+            collection = get_meetup_collection("notion_pages")
+            await collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            # ordered=False: 실패한 문서만 writeErrors에 포함, 나머지는 저장됨
+            for write_error in e.details.get("writeErrors", []):
+                failures[write_error["index"]] = DatabaseOperationException(
+                    f"노션 페이지 저장 실패: {write_error.get('errmsg')}",
+                    original_exception=e,
+                )
+            logger.error(
+                f"❌ 노션 페이지 배치 일부 저장 실패 ({len(failures)}/{len(batch)}개)"
+            )
+        except Exception as e:
+            failures = dict.fromkeys(range(len(batch)), e)
+            logger.error(f"❌ 노션 페이지 배치 저장 실패 ({len(batch)}개): {e}")
+
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            error = failures.get(index)
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+
 # Global instances (used throughout the application)
 mongodb_connection = MongoDBConnectionManager()
 schema_cache_manager = NotionSchemaCacheManager(mongodb_connection)
 thread_cache_manager = DiscordThreadCacheManager(mongodb_connection)
 metrics_collector = PerformanceMetricsCollector(mongodb_connection)
+notion_page_batcher = NotionPageBatcher(mongodb_connection)
 
 
 # ===== DinoBot 서비스 전용 컬렉션 정의 =====
@@ -1258,6 +1459,13 @@ async def get_user_command_history(
     return documents
 
 
+# 사용자별 최근 페이지 조회 캐시: user_id -> (저장 시각, 페이지 문서)
+# 연속된 /fetch 명령의 MongoDB 왕복을 줄이기 위한 짧은 TTL 캐시
+RECENT_PAGE_CACHE_TTL = 30
+RECENT_PAGE_CACHE_MAX_SIZE = 1024
+_recent_page_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+
 async def save_notion_page(
     page_id: str,
     database_id: str,
@@ -1271,6 +1479,7 @@ async def save_notion_page(
         collection = get_meetup_collection("notion_pages")
 
         page_document = {
+            "_id": ObjectId(),
             "page_id": page_id,
             "database_id": database_id,
             "page_type": page_type,  # "task", "meeting", etc.
@@ -1280,9 +1489,15 @@ async def save_notion_page(
             "metadata": metadata or {},
         }
 
-        result = await collection.insert_one(page_document)
+        if notion_page_batcher.is_running:
+            # 배치 워커가 insert_many로 저장할 때까지 대기 (실패 시 예외 전달)
+            await notion_page_batcher.submit(page_document)
+        else:
+            await collection.insert_one(page_document)
+        # 최근 페이지 캐시 무효화는 여기서만 수행 (두 저장 경로 모두 저장 완료 후)
+        _recent_page_cache.pop(created_by, None)
         logger.info(f"📝 노션 페이지 저장 완료: {title} (ID: {page_id})")
-        return str(result.inserted_id)
+        return str(page_document["_id"])
 
     except Exception as e:
         logger.error(f"❌ 노션 페이지 저장 실패: {e}")
@@ -1304,7 +1519,11 @@ async def get_recent_notion_pages(limit: int = 20) -> List[Dict[str, Any]]:
 async def get_recent_notion_page_by_user(
     user_id: str, limit: int = 5
 ) -> Optional[Dict[str, Any]]:
-    """특정 사용자가 최근에 생성한 노션 페이지 조회"""
+    """특정 사용자가 최근에 생성한 노션 페이지 조회 (RECENT_PAGE_CACHE_TTL 동안 캐시)"""
+    cached = _recent_page_cache.get(user_id)
+    if cached is not None and time.monotonic() - cached[0] < RECENT_PAGE_CACHE_TTL:
+        return cached[1]
+
     try:
         collection = get_meetup_collection("notion_pages")
         cursor = (
@@ -1312,11 +1531,18 @@ async def get_recent_notion_page_by_user(
         )
 
         documents = await cursor.to_list(length=limit)
+        recent_page = None
         if documents:
             for doc in documents:
                 doc["_id"] = str(doc["_id"])
-            return documents[0]  # 가장 최근 페이지 반환
-        return None
+            recent_page = documents[0]  # 가장 최근 페이지 반환
+
+        # 가득 차면 가장 오래 전에 저장된 항목부터 제거
+        _recent_page_cache.pop(user_id, None)
+        if len(_recent_page_cache) >= RECENT_PAGE_CACHE_MAX_SIZE:
+            _recent_page_cache.pop(next(iter(_recent_page_cache)))
+        _recent_page_cache[user_id] = (time.monotonic(), recent_page)
+        return recent_page
 
     except Exception as e:
         logger.error(f"❌ 사용자별 최근 페이지 조회 실패: {e}")
@@ -2,7 +2,6 @@
 메트릭 수집을 위한 데코레이터들
 """
 
-import time
 import functools
 import logging
 from typing import Callable, Any
@@ -15,33 +14,25 @@ def track_discord_command(command_name: str):
     """Discord 명령어 실행 추적 데코레이터"""
 
     def decorator(func: Callable) -> Callable:
+        # 호출마다 수집기/메서드를 조회하지 않도록 데코레이션 시점에 바인딩
+        time_discord_command = get_metrics_collector().time_discord_command
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
             user = "unknown"
 
-            try:
-                # 사용자 정보 추출 (Discord 서비스에서)
-                if len(args) > 0 and hasattr(args[0], "user"):
-                    user = (
-                        str(args[0].user.id)
-                        if hasattr(args[0].user, "id")
-                        else "unknown"
-                    )
-
-                result = await func(*args, **kwargs)
-                return result
-
-            except Exception as e:
-                status = "error"
-                logger.error(f"Discord 명령어 실행 실패: {command_name} - {e}")
-                raise
+            # 사용자 정보 추출 (Discord 서비스에서)
+            if len(args) > 0 and hasattr(args[0], "user"):
+                user = (
+                    str(args[0].user.id) if hasattr(args[0].user, "id") else "unknown"
+                )
 
-            finally:
-                duration = time.time() - start_time
-                metrics = get_metrics_collector()
-                metrics.record_discord_command(command_name, user, status, duration)
+            with time_discord_command(command_name, user):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Discord 명령어 실행 실패: {command_name} - {e}")
+                    raise
 
         return wrapper
 
@@ -52,24 +43,16 @@ def track_notion_api(operation: str, database: str = "unknown"):
     """Notion API 호출 추적 데코레이터"""
 
     def decorator(func: Callable) -> Callable:
+        time_notion_api_call = get_metrics_collector().time_notion_api_call
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
-
-            try:
-                result = await func(*args, **kwargs)
-                return result
-
-            except Exception as e:
-                status = "error"
-                logger.error(f"Notion API 호출 실패: {operation} - {e}")
-                raise
-
-            finally:
-                duration = time.time() - start_time
-                metrics = get_metrics_collector()
-                metrics.record_notion_api_call(operation, database, status, duration)
+            with time_notion_api_call(operation, database):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Notion API 호출 실패: {operation} - {e}")
+                    raise
 
         return wrapper
 
@@ -80,24 +63,16 @@ def track_mongodb_query(operation: str, collection: str = "unknown"):
     """MongoDB 쿼리 추적 데코레이터"""
 
     def decorator(func: Callable) -> Callable:
+        time_mongodb_query = get_metrics_collector().time_mongodb_query
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
-
-            try:
-                result = await func(*args, **kwargs)
-                return result
-
-            except Exception as e:
-                status = "error"
-                logger.error(f"MongoDB 쿼리 실패: {operation} - {e}")
-                raise
-
-            finally:
-                duration = time.time() - start_time
-                metrics = get_metrics_collector()
-                metrics.record_mongodb_query(operation, collection, status, duration)
+            with time_mongodb_query(operation, collection):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"MongoDB 쿼리 실패: {operation} - {e}")
+                    raise
 
         return wrapper
 
@@ -108,6 +83,8 @@ def track_error(service: str, error_type: str = "unknown"):
     """에러 추적 데코레이터"""
 
     def decorator(func: Callable) -> Callable:
+        record_error = get_metrics_collector().record_error
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             try:
@@ -115,8 +92,7 @@ def track_error(service: str, error_type: str = "unknown"):
                 return result
 
             except Exception as e:
-                metrics = get_metrics_collector()
-                metrics.record_error(service, error_type)
+                record_error(service, error_type)
                 logger.error(f"에러 발생: {service} - {error_type} - {e}")
                 raise
 
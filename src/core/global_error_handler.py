@@ -5,11 +5,14 @@
 - 상세 로그는 파일에 기록
 """
 
+import heapq
 import sys
+import time
+import logging
+import threading
 import traceback
 import asyncio
-from typing import Optional, Dict, Any, Callable
-from datetime import datetime
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from enum import Enum
 
 from src.core.logger import get_logger
@@ -31,11 +34,22 @@ class GlobalErrorHandler:
     """전역 오류 처리기"""
 
     def __init__(self):
-        self.error_counts = {}
-        self.last_error_time = {}
+        # error_key -> (발생 횟수, 마지막 발생 시각[time.monotonic()])
+        self.error_stats: Dict[str, Tuple[int, float]] = {}
+        # (발생 시각, error_key) 최소 힙 - 만료 항목만 O(log N)으로 제거
+        self._expiry_heap: List[Tuple[float, str]] = []
         self.error_threshold = 10  # 같은 오류가 10번 발생하면 경고
         self.time_window = 300  # 5분 윈도우
 
+        # 반복 오류 출력 억제 (처음 N회는 모두 출력, 이후 지수 백오프)
+        self.emit_burst_limit = 3
+        self.max_emit_interval = 60  # 초
+        self._emit_next_allowed: Dict[str, float] = {}
+        self._suppressed_counts: Dict[str, int] = {}
+
+        # sys.excepthook(다른 스레드)과 asyncio 핸들러가 동시에 통계를 갱신할 수 있음
+        self._stats_lock = threading.Lock()
+
     def handle_exception(
         self,
         exception: Exception,
@@ -48,16 +62,21 @@ class GlobalErrorHandler:
             # 오류 정보 수집
             error_info = self._collect_error_info(exception, context, severity)
 
-            # 오류 카운트 업데이트
-            self._update_error_counts(error_info)
+            with self._stats_lock:
+                # 오류 카운트 업데이트
+                self._update_error_counts(error_info)
 
-            # 터미널에 간결한 오류 메시지 표시
-            self._display_terminal_error(error_info, show_traceback)
+                # 같은 오류가 폭주하는 경우 출력만 생략 (카운트/임계값 처리는 유지)
+                should_emit = self._should_emit(error_info)
 
-            # 상세 로그 기록
-            self._log_detailed_error(error_info)
+            if should_emit:
+                # 터미널에 간결한 오류 메시지 표시
+                self._display_terminal_error(error_info, show_traceback)
 
-            # 심각한 오류인 경우 추가 처리
+                # 상세 로그 기록
+                self._log_detailed_error(error_info)
+
+            # 심각한 오류인 경우 추가 처리 (출력 생략 여부와 무관하게 매번 확인)
             if severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]:
                 self._handle_critical_error(error_info)
 
@@ -72,7 +91,7 @@ class GlobalErrorHandler:
         """오류 정보 수집"""
         error_type = type(exception).__name__
         error_message = str(exception)
-        timestamp = datetime.now()
+        timestamp = time.monotonic()
 
         return {
             "exception": exception,
@@ -81,10 +100,21 @@ class GlobalErrorHandler:
             "context": context,
             "severity": severity,
             "timestamp": timestamp,
-            "traceback": traceback.format_exc(),
+            # traceback 문자열은 실제로 출력할 때만 생성 (_get_traceback)
+            "exc_info": (type(exception), exception, exception.__traceback__),
+            "traceback": None,
             "error_key": f"{error_type}:{context}",
         }
 
+    @staticmethod
+    def _get_traceback(error_info: Dict[str, Any]) -> str:
+        """traceback 문자열을 최초 요청 시 생성하고 재사용"""
+        if error_info["traceback"] is None:
+            error_info["traceback"] = "".join(
+                traceback.format_exception(*error_info["exc_info"])
+            )
+        return error_info["traceback"]
+
     def _update_error_counts(self, error_info: Dict[str, Any]) -> None:
         """오류 발생 횟수 업데이트"""
         error_key = error_info["error_key"]
@@ -93,24 +123,59 @@ class GlobalErrorHandler:
         # 오래된 오류 카운트 정리
         self._cleanup_old_errors(current_time)
 
-        # 현재 오류 카운트 증가
-        if error_key not in self.error_counts:
-            self.error_counts[error_key] = 0
-        self.error_counts[error_key] += 1
-        self.last_error_time[error_key] = current_time
+        # 현재 오류 카운트 증가 (해시 조회 1회)
+        count, _ = self.error_stats.get(error_key, (0, current_time))
+        self.error_stats[error_key] = (count + 1, current_time)
+        heapq.heappush(self._expiry_heap, (current_time, error_key))
+        error_info["count"] = count + 1
 
-    def _cleanup_old_errors(self, current_time: datetime) -> None:
+    def _cleanup_old_errors(self, current_time: float) -> None:
         """오래된 오류 카운트 정리"""
-        cutoff_time = current_time.timestamp() - self.time_window
-        keys_to_remove = []
+        cutoff_time = current_time - self.time_window
+        expiry_heap = self._expiry_heap
+
+        while expiry_heap and expiry_heap[0][0] < cutoff_time:
+            timestamp, error_key = heapq.heappop(expiry_heap)
+            stats = self.error_stats.get(error_key)
+            # 이후에 다시 발생한 오류라면 최신 힙 항목이 남아 있으므로 유지
+            if stats is not None and stats[1] == timestamp:
+                del self.error_stats[error_key]
+                self._flush_suppressed_summary(error_key)
+
+    def _should_emit(self, error_info: Dict[str, Any]) -> bool:
+        """오류 출력 여부 결정 (error_key별 지수 백오프)"""
+        error_key = error_info["error_key"]
+        now = error_info["timestamp"]
+        count = error_info["count"]
+
+        if count > self.emit_burst_limit:
+            if now < self._emit_next_allowed.get(error_key, 0.0):
+                self._suppressed_counts[error_key] = (
+                    self._suppressed_counts.get(error_key, 0) + 1
+                )
+                return False
+
+            backoff = 2 ** min(count.bit_length(), 6)
+            self._emit_next_allowed[error_key] = now + min(
+                self.max_emit_interval, backoff
+            )
 
-        for error_key, last_time in self.last_error_time.items():
-            if last_time.timestamp() < cutoff_time:
-                keys_to_remove.append(error_key)
+        suppressed = self._suppressed_counts.pop(error_key, 0)
+        if suppressed:
+            error_info["suppressed_count"] = suppressed
+        return True
 
-        for key in keys_to_remove:
-            self.error_counts.pop(key, None)
-            self.last_error_time.pop(key, None)
+    def _flush_suppressed_summary(self, error_key: str) -> None:
+        """만료된 오류의 생략 건수를 요약 로그로 기록"""
+        self._emit_next_allowed.pop(error_key, None)
+        suppressed = self._suppressed_counts.pop(error_key, 0)
+        if suppressed:
+            logger.warning(f"Suppressed {suppressed} repeated errors for {error_key}")
+
+    @property
+    def error_counts(self) -> Dict[str, int]:
+        """error_key별 발생 횟수"""
+        return {key: count for key, (count, _) in list(self.error_stats.items())}
 
     def _display_terminal_error(
         self, error_info: Dict[str, Any], show_traceback: bool
@@ -120,8 +185,7 @@ class GlobalErrorHandler:
         error_message = error_info["error_message"]
         context = error_info["context"]
         severity = error_info["severity"]
-        error_key = error_info["error_key"]
-        count = self.error_counts.get(error_key, 1)
+        count = error_info.get("count", 1)
 
         # 심각도에 따른 이모지 선택
         severity_emoji = {
@@ -144,15 +208,18 @@ class GlobalErrorHandler:
         # 반복 발생한 오류인 경우 카운트 표시
         if count > 1:
             message += f" (x{count})"
-
-        # 터미널에 출력
-        print(message, file=sys.stderr)
+        suppressed = error_info.get("suppressed_count")
+        if suppressed:
+            message += f" [{suppressed}건 출력 생략]"
 
         # 심각한 오류이거나 traceback을 요청한 경우 상세 정보 표시
         if show_traceback or severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]:
-            traceback_lines = error_info["traceback"].split("\n")
+            traceback_lines = self._get_traceback(error_info).split("\n")
             location = traceback_lines[-2] if len(traceback_lines) > 1 else "Unknown"
-            print(f"📍 위치: {location}", file=sys.stderr)
+            message += f"\n📍 위치: {location}"
+
+        # 터미널에 출력 (오류당 write 1회)
+        sys.stderr.write(message + "\n")
 
     def _log_detailed_error(self, error_info: Dict[str, Any]) -> None:
         """상세 오류 로그 기록"""
@@ -160,7 +227,6 @@ class GlobalErrorHandler:
         context = error_info["context"]
         error_type = error_info["error_type"]
         error_message = error_info["error_message"]
-        traceback_str = error_info["traceback"]
 
         # 로그 레벨 결정
         log_level = {
@@ -173,20 +239,22 @@ class GlobalErrorHandler:
         # 상세 로그 메시지
         log_message = f"Exception in {context}: {error_type}: {error_message}"
 
+        # 터미널에는 간결한 메시지만, traceback은 파일 로그(JSON tb 필드)에 기록
         if log_level == "critical":
-            logger.critical(log_message)
-            logger.critical(f"Traceback: {traceback_str}")
+            logger.critical(log_message, extra={"tb": self._get_traceback(error_info)})
         elif log_level == "error":
-            logger.error(log_message)
-            logger.error(f"Traceback: {traceback_str}")
+            logger.error(log_message, extra={"tb": self._get_traceback(error_info)})
         else:
-            logger.warning(log_message)
-            logger.warning(f"Traceback: {traceback_str}")
+            # 경미한 오류의 traceback은 DEBUG 레벨이 활성화된 경우에만 생성
+            extra = None
+            if logger.isEnabledFor(logging.DEBUG):
+                extra = {"tb": self._get_traceback(error_info)}
+            logger.warning(log_message, extra=extra)
 
     def _handle_critical_error(self, error_info: Dict[str, Any]) -> None:
         """심각한 오류 처리"""
         error_key = error_info["error_key"]
-        count = self.error_counts.get(error_key, 1)
+        count = error_info.get("count", 1)
 
         # 같은 오류가 임계값을 초과한 경우
         if count >= self.error_threshold:
@@ -200,15 +268,16 @@ class GlobalErrorHandler:
 
     def get_error_summary(self) -> Dict[str, Any]:
         """오류 요약 정보 반환"""
-        current_time = datetime.now()
-        self._cleanup_old_errors(current_time)
+        with self._stats_lock:
+            self._cleanup_old_errors(time.monotonic())
+            error_counts = self.error_counts
 
         return {
-            "total_unique_errors": len(self.error_counts),
-            "error_counts": dict(self.error_counts),
+            "total_unique_errors": len(error_counts),
+            "error_counts": error_counts,
             "high_frequency_errors": {
                 key: count
-                for key, count in self.error_counts.items()
+                for key, count in error_counts.items()
                 if count >= self.error_threshold
             },
         }
@@ -278,6 +347,31 @@ def safe_async_execute(
     return wrapper
 
 
+def asyncio_exception_handler(loop, context):
+    """asyncio 이벤트 루프 예외 처리기"""
+    exception = context.get("exception")
+    message = context.get("message", "Unknown")
+
+    # Unclosed client session warning은 무시 (정상적인 종료 과정)
+    if "Unclosed client session" in message:
+        return  # 이 warning은 무시
+
+    if exception:
+        handle_async_exception(
+            exception,
+            f"AsyncIO: {message}",
+            ErrorSeverity.HIGH,
+        )
+    else:
+        # 다른 AsyncIO context 메시지도 무시 (너무 많은 로그 방지)
+        pass
+
+
+def install_on_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """지정한 이벤트 루프에 asyncio 예외 처리기 설치"""
+    loop.set_exception_handler(asyncio_exception_handler)
+
+
 # 예외 처리기 설정
 def setup_global_exception_handlers():
     """전역 예외 처리기 설정"""
@@ -297,33 +391,13 @@ def setup_global_exception_handlers():
 
     sys.excepthook = exception_handler
 
-    # asyncio 예외 처리기 설정
-    def asyncio_exception_handler(loop, context):
-        exception = context.get("exception")
-        message = context.get("message", "Unknown")
-
-        # Unclosed client session warning은 무시 (정상적인 종료 과정)
-        if "Unclosed client session" in message:
-            return  # 이 warning은 무시
-
-        if exception:
-            handle_async_exception(
-                exception,
-                f"AsyncIO: {message}",
-                ErrorSeverity.HIGH,
-            )
-        else:
-            # 다른 AsyncIO context 메시지도 무시 (너무 많은 로그 방지)
-            pass
-
-    # 현재 이벤트 루프가 있으면 설정
+    # 실행 중인 이벤트 루프에서 호출된 경우에만 asyncio 예외 처리기 설치
+    # (루프가 없으면 애플리케이션 시작 시 install_on_loop로 설치)
     try:
-        loop = asyncio.get_event_loop()
-        loop.set_exception_handler(asyncio_exception_handler)
+        install_on_loop(asyncio.get_running_loop())
     except RuntimeError:
-        # 이벤트 루프가 없는 경우, 나중에 설정
         pass
 
 
-# 모듈 로드 시 자동 설정
+# 모듈 로드 시 sys.excepthook 설정 (루프와 무관)
 setup_global_exception_handlers()
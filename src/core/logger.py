@@ -1,6 +1,13 @@
 """중앙집중식 로깅 시스템 - 모든 로그를 통합 관리하고 형식을 일관성 있게 유지"""
 
+import atexit
+import contextlib
+import copy
+import functools
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 from datetime import datetime
@@ -8,6 +15,18 @@ from pathlib import Path
 
 from .config import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_json(payload: dict) -> str:
+    """JSON 직렬화 (orjson 설치 시 사용, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
 
 class KoreanLoggerFormatter(logging.Formatter):
     """
@@ -26,30 +45,92 @@ class KoreanLoggerFormatter(logging.Formatter):
         "RESET": "\033[0m",  # 색상 리셋
     }
 
+    # 모듈명 앞에서 제거할 네임스페이스 접두어
+    namespace_prefix = "dinobot."
+
+    def __init__(self):
+        # asctime은 logging.Formatter의 기본 시간 포맷 경로를 사용
+        super().__init__(
+            fmt="%(asctime)s | %(levelcolor)s | %(shortname)-20s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+        # 레벨별 색상 라벨을 미리 계산 (레코드마다 문자열 조합 방지)
+        reset_color = self.color_codes["RESET"]
+        self._level_labels = {
+            level_name: f"{color}{level_name:8}{reset_color}"
+            for level_name, color in self.color_codes.items()
+            if level_name != "RESET"
+        }
+
     def format(self, record):
         """로그 레코드를 한국어 친화적 형식으로 변환"""
-        # 시간 포맷: YYYY-MM-DD HH:MM:SS
-        time_string = datetime.fromtimestamp(record.created).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        level_label = self._level_labels.get(record.levelname)
+        if level_label is None:
+            level_label = f"{record.levelname:8}"
+        record.levelcolor = level_label
 
         # 모듈 경로를 짧게 변환 (예: dinobot.services.notion -> services.notion)
         module_name = record.name
-        if module_name.startswith("dinobot."):
-            module_name = module_name[12:]  # 'dinobot.' 제거
+        if module_name.startswith(self.namespace_prefix):
+            module_name = module_name[len(self.namespace_prefix) :]
+        record.shortname = module_name
+
+        return super().format(record)
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    파일 로그용 JSON Lines 포매터
+    - 레코드당 한 줄의 JSON 객체 (ts, level, mod, msg, tb)
+    - traceback은 TracebackQueueHandler가 넣은 record.tb 또는 extra={"tb": ...}로 포함
+    """
+
+    def __init__(self):
+        super().__init__(datefmt="%Y-%m-%dT%H:%M:%S")
+
+    def format(self, record):
+        payload = {
+            "ts": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "mod": record.name,
+            "msg": record.getMessage(),
+        }
+
+        traceback_text = getattr(record, "tb", None)
+        if record.exc_info:
+            traceback_text = self.formatException(record.exc_info)
+        if traceback_text:
+            payload["tb"] = traceback_text
+
+        return _dumps_json(payload)
 
-        # 색상 적용 (터미널 환경에서만)
-        level_color = self.color_codes.get(record.levelname, "")
-        reset_color = self.color_codes["RESET"]
 
-        # 로그 메시지 조합
-        formatted_message = f"{time_string} | {level_color}{record.levelname:8}{reset_color} | {module_name:20} | {record.getMessage()}"
+class TracebackQueueHandler(logging.handlers.QueueHandler):
+    """
+    traceback을 msg에 합치지 않는 큐 핸들러
+    - 기본 prepare()는 traceback을 msg에 붙이고 exc_info를 지움
+    - 여기서는 msg는 본문만, traceback은 record.tb(JSON)와 exc_text(콘솔)에 보관
+    """
 
-        # 예외 정보가 있으면 추가
+    _traceback_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
         if record.exc_info:
-            formatted_message += f"\n{self.formatException(record.exc_info)}"
+            record.tb = self._traceback_formatter.formatException(record.exc_info)
+            record.exc_text = record.tb
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
 
-        return formatted_message
+class LazyDirectoryTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """로그 디렉토리를 실제 파일을 열 때 생성하는 자정 로테이션 핸들러"""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
 
 
 class CentralLoggerManager:
@@ -58,12 +139,15 @@ class CentralLoggerManager:
     - 파일과 콘솔에 동시 출력
     - 레벨별 필터링
     - 로그 파일 로테이션
+    - QueueHandler/QueueListener로 실제 I/O는 백그라운드 스레드에서 처리
     """
 
     def __init__(self):
         self.logger_instance = None
         self.log_file_path = None
         self.initialized = False
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._logger_cache: dict[str, logging.Logger] = {}
 
     def initialize_logger_system(
         self, log_level: str = "INFO", log_to_file: bool = True
@@ -92,11 +176,20 @@ class CentralLoggerManager:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(getattr(logging, log_level.upper()))
-        root_logger.addHandler(console_handler)
+        output_handlers = [console_handler]
 
         # 2. 파일 출력 핸들러 설정 (선택사항)
         if log_to_file:
-            self._setup_file_handler(root_logger, formatter)
+            output_handlers.append(self._setup_file_handler(JsonLogFormatter()))
+
+        # 루트 로거에는 큐 핸들러만 연결 (이벤트 루프 스레드는 enqueue만 수행)
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(TracebackQueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *output_handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
 
         # 3. 특정 라이브러리 로그 레벨 조정
         # httpx HTTP 요청 로그를 WARNING 레벨로 설정 (INFO 레벨에서 숨김)
@@ -117,21 +210,29 @@ class CentralLoggerManager:
 
         return self.logger_instance
 
-    def _setup_file_handler(self, root_logger, formatter):
-        """파일 출력을 위한 핸들러 설정"""
-        # 로그 디렉토리 생성
-        log_directory = Path("logs")
-        log_directory.mkdir(exist_ok=True)
-
-        # 로그 파일명에 날짜 포함
-        today_date = datetime.now().strftime("%Y%m%d")
-        self.log_file_path = log_directory / f"dinobot_{today_date}.log"
-
-        # 파일 핸들러 생성 (UTF-8 인코딩으로 한글 지원)
-        file_handler = logging.FileHandler(self.log_file_path, encoding="utf-8")
+    def _setup_file_handler(self, formatter) -> logging.Handler:
+        """파일 출력을 위한 핸들러 생성"""
+        # 날짜별 파일은 자정 로테이션으로 관리 (장기 실행 시에도 당일 파일에 기록)
+        self.log_file_path = Path("logs") / "dinobot.log"
+
+        # 파일 핸들러 생성 (UTF-8 인코딩으로 한글 지원, 첫 기록 시점에 파일 생성)
+        file_handler = LazyDirectoryTimedRotatingFileHandler(
+            self.log_file_path,
+            when="midnight",
+            interval=1,
+            backupCount=14,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)  # 파일에는 모든 레벨 저장
-        root_logger.addHandler(file_handler)
+        return file_handler
+
+    def shutdown(self):
+        """큐에 남은 로그를 모두 기록하고 리스너 스레드 종료"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
 
     def create_module_logger(self, module_name: str):
         """
@@ -143,12 +244,17 @@ class CentralLoggerManager:
         Returns:
             logging.Logger: 설정된 로거 인스턴스
         """
+        cached_logger = self._logger_cache.get(module_name)
+        if cached_logger is not None:
+            return cached_logger
+
         if not self.initialized:
             self.initialize_logger_system()
 
         # dinobot 네임스페이스 하위에 로거 생성
         full_module_name = f"dinobot.{module_name}"
         module_logger = logging.getLogger(full_module_name)
+        self._logger_cache[module_name] = module_logger
 
         return module_logger
 
@@ -161,9 +267,14 @@ class CentralLoggerManager:
                 # 시간 측정 대상 코드
                 result = await notion_service.create_task()
         """
-        return PerformanceMeasurementContext(
-            task_name, self.create_module_logger("performance")
-        )
+        performance_logger = self.create_module_logger("performance")
+        # 로그가 출력되지 않는 레벨이면 측정 없이 공유 no-op 컨텍스트 반환
+        if not performance_logger.isEnabledFor(logging.INFO):
+            return _NOOP_CONTEXT
+        return PerformanceMeasurementContext(task_name, performance_logger)
+
+
+_NOOP_CONTEXT = contextlib.nullcontext()
 
 
 class PerformanceMeasurementContext:
@@ -199,6 +310,7 @@ class PerformanceMeasurementContext:
 logger_manager = CentralLoggerManager()
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(module_name: str) -> logging.Logger:
     """
     간편한 로거 생성 함수
@@ -5,205 +5,414 @@ Prometheus 메트릭 수집 모듈
 - 비즈니스 메트릭
 """
 
-from prometheus_client import Counter, Histogram, Gauge, start_http_server, CollectorRegistry
+from prometheus_client import (
+    Counter,
+    Histogram,
+    Gauge,
+    start_http_server,
+    CollectorRegistry,
+    disable_created_metrics,
+)
+import collections
+import sys
+import threading
 import time
-from typing import Dict, Any
+import zlib
+from typing import Dict, Any, Deque, Optional
 import logging
 
+from .constants import DatabaseConstants, NotionConstants, UserConstants
+
 logger = logging.getLogger(__name__)
 
+# 시작 시점에 자식 메트릭을 미리 생성할 라벨 값 (카디널리티가 낮고 값이 고정된 라벨)
+KNOWN_LABELS = {
+    'discord_threads_created': tuple(DatabaseConstants.PAGE_TYPES),
+    'documents_created': tuple(NotionConstants.DOCUMENT_TYPES),
+}
+
+# 사용자 단위 라벨의 최대 시계열 수 (사용자 ID는 이 개수의 버킷으로 해시)
+MAX_LABEL_CARDINALITY = 64
+
+# 회의 참석자 수 버킷 (상한, 라벨)
+PARTICIPANT_BUCKETS = ((0, '0'), (1, '1'), (5, '2-5'), (20, '6-20'))
+PARTICIPANT_OVERFLOW_BUCKET = '>20'
+
+_KNOWN_PERSONS = frozenset(UserConstants.VALID_PERSONS)
+
+# 라벨 문자열 인터닝 (같은 값은 같은 객체 → 캐시된 해시와 동일성 비교로 dict 조회)
+_intern = sys.intern
+STATUS_SUCCESS = _intern('success')
+STATUS_ERROR = _intern('error')
+
+# 자식 메트릭마다 붙는 *_created 샘플을 비활성화 (스크레이프 시 라벨 직렬화 횟수 절감)
+disable_created_metrics()
+
+
+def _bucket_user(user: str) -> str:
+    """사용자 ID를 고정 개수의 버킷 라벨로 변환 (프로세스 재시작에도 안정적인 crc32 사용)"""
+    if user == 'unknown':
+        return user
+    return _intern(f'bucket_{zlib.crc32(str(user).encode()) % MAX_LABEL_CARDINALITY}')
+
+
+def _bucket_participants(participants_count: int) -> str:
+    """참석자 수를 구간 라벨로 변환"""
+    for upper_bound, label in PARTICIPANT_BUCKETS:
+        if participants_count <= upper_bound:
+            return label
+    return PARTICIPANT_OVERFLOW_BUCKET
+
+
+def _bucket_person(person: str) -> str:
+    """등록된 담당자 외의 값은 'other'로 묶음"""
+    return person if person in _KNOWN_PERSONS else 'other'
+
+# 링 버퍼 설정 (가득 차면 가장 오래된 항목부터 버림)
+RING_BUFFER_SIZE = 65536
+DRAIN_BATCH_SIZE = 4096
+DRAIN_INTERVAL_SECONDS = 0.5
+
+# 시계열 만료 설정 (TTL 동안 갱신이 없거나 최대 개수를 넘으면 오래된 것부터 제거)
+METRIC_EXPIRATION_SECONDS = 600
+MAX_SERIES = 10000
+
+# 링 버퍼 항목 연산 종류
+_OP_INC = 'inc'
+_OP_OBSERVE = 'observe'
+_OP_SET = 'set'
+
+# 히스토그램 버킷 (기본 15개 대신 실제 지연 분포 구간만 사용)
+API_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+# 메트릭 정의: (속성명, 타입, 메트릭명, 설명, 라벨명, 추가 인자)
+_METRIC_SPECS = (
+    # Discord 관련 메트릭
+    ('discord_commands', Counter, 'discord_commands_total',
+     'Total Discord commands executed', ('command', 'user', 'status'), ()),
+    ('discord_command_duration', Histogram, 'discord_command_duration_seconds',
+     'Discord command execution time', ('command',),
+     (('buckets', API_LATENCY_BUCKETS),)),
+    # Notion API 관련 메트릭
+    ('notion_api_calls', Counter, 'notion_api_calls_total',
+     'Total Notion API calls', ('operation', 'database', 'status'), ()),
+    ('notion_api_duration', Histogram, 'notion_api_duration_seconds',
+     'Notion API call duration', ('operation',),
+     (('buckets', API_LATENCY_BUCKETS),)),
+    # MongoDB 관련 메트릭
+    ('mongodb_queries', Counter, 'mongodb_queries_total',
+     'Total MongoDB queries', ('operation', 'collection', 'status'), ()),
+    ('mongodb_query_duration', Histogram, 'mongodb_query_duration_seconds',
+     'MongoDB query duration', ('operation', 'collection'),
+     (('buckets', DB_LATENCY_BUCKETS),)),
+    # 시스템 메트릭
+    ('active_users', Gauge, 'active_users_total',
+     'Number of active users', (), ()),
+    ('notion_pages_synced', Gauge, 'notion_pages_synced_total',
+     'Total Notion pages synced', ('database',), ()),
+    ('discord_threads_created', Counter, 'discord_threads_created_total',
+     'Total Discord threads created', ('page_type',), ()),
+    # 에러 메트릭
+    ('errors_total', Counter, 'errors_total',
+     'Total errors', ('service', 'error_type'), ()),
+    # 비즈니스 메트릭
+    ('meetings_created', Counter, 'meetings_created_total',
+     'Total meetings created', ('participants_count',), ()),
+    ('tasks_created', Counter, 'tasks_created_total',
+     'Total tasks created', ('priority', 'person'), ()),
+    ('documents_created', Counter, 'documents_created_total',
+     'Total documents created', ('doc_type',), ()),
+    # 수집기 자체 메트릭
+    ('samples_dropped', Counter, 'metrics_samples_dropped_total',
+     'Metric samples dropped because the ring buffer was full', (), ()),
+)
+
+
+def _build_metric(spec: tuple, registry: CollectorRegistry):
+    """스펙 하나로 메트릭 생성"""
+    _, metric_type, name, documentation, labelnames, extra_kwargs = spec
+    return metric_type(
+        name, documentation, labelnames, registry=registry, **dict(extra_kwargs)
+    )
+
+
+def _make_recorder(append, counter, histogram, normalize_second, observe_second: bool):
+    """(카운터, 히스토그램) 쌍 전용 record 함수 생성 (메트릭/라벨 구성을 클로저에 고정)"""
+    if observe_second:
+        def record(first: str, second: str, status: str, duration: float):
+            labels = (_intern(first), normalize_second(second))
+            append((_OP_INC, counter, labels + (_intern(status),), 1))
+            append((_OP_OBSERVE, histogram, labels, duration))
+    else:
+        def record(first: str, second: str, status: str, duration: float):
+            first = _intern(first)
+            append((_OP_INC, counter, (first, normalize_second(second), _intern(status)), 1))
+            append((_OP_OBSERVE, histogram, (first,), duration))
+    return record
+
+
+class _Timer:
+    """monotonic_ns 기반 실행 시간 측정 컨텍스트 매니저 (종료 시 record 콜백 호출)"""
+
+    __slots__ = ('start', 'record', 'labels')
+
+    def __init__(self, record, labels: tuple):
+        self.record = record
+        self.labels = labels
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.monotonic_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        duration = (time.monotonic_ns() - self.start) * 1e-9
+        status = STATUS_ERROR if exc_type is not None else STATUS_SUCCESS
+        self.record(*self.labels, status, duration)
+        return False
+
+
 class MetricsCollector:
     """메트릭 수집기 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        metric_expiration_seconds: float = METRIC_EXPIRATION_SECONDS,
+        max_series: int = MAX_SERIES,
+    ):
         self.registry = CollectorRegistry()
+        # id(metric) -> {라벨 값 튜플: 자식 메트릭} (labels() 조회/락 비용 절감)
+        self._child_cache: Dict[int, Dict[tuple, Any]] = {}
+        # (metric, 라벨 값 튜플) -> 마지막 갱신 시각 (오래된 순서 유지)
+        self._last_touch: 'collections.OrderedDict[tuple, float]' = collections.OrderedDict()
+        self._pinned_series = set()
+        self.metric_expiration_seconds = metric_expiration_seconds
+        self.max_series = max(1, max_series)
+        self._next_sweep = time.monotonic() + metric_expiration_seconds
         self._init_metrics()
-    
-    def _init_metrics(self):
-        """메트릭 초기화"""
-        
-        # Discord 관련 메트릭
-        self.discord_commands = Counter(
-            'discord_commands_total',
-            'Total Discord commands executed',
-            ['command', 'user', 'status'],
-            registry=self.registry
-        )
-        
-        self.discord_command_duration = Histogram(
-            'discord_command_duration_seconds',
-            'Discord command execution time',
-            ['command'],
-            registry=self.registry
-        )
-        
-        # Notion API 관련 메트릭
-        self.notion_api_calls = Counter(
-            'notion_api_calls_total',
-            'Total Notion API calls',
-            ['operation', 'database', 'status'],
-            registry=self.registry
-        )
-        
-        self.notion_api_duration = Histogram(
-            'notion_api_duration_seconds',
-            'Notion API call duration',
-            ['operation'],
-            registry=self.registry
-        )
-        
-        # MongoDB 관련 메트릭
-        self.mongodb_queries = Counter(
-            'mongodb_queries_total',
-            'Total MongoDB queries',
-            ['operation', 'collection', 'status'],
-            registry=self.registry
-        )
-        
-        self.mongodb_query_duration = Histogram(
-            'mongodb_query_duration_seconds',
-            'MongoDB query duration',
-            ['operation', 'collection'],
-            registry=self.registry
-        )
-        
-        # 시스템 메트릭
-        self.active_users = Gauge(
-            'active_users_total',
-            'Number of active users',
-            registry=self.registry
-        )
-        
-        self.notion_pages_synced = Gauge(
-            'notion_pages_synced_total',
-            'Total Notion pages synced',
-            ['database'],
-            registry=self.registry
-        )
-        
-        self.discord_threads_created = Counter(
-            'discord_threads_created_total',
-            'Total Discord threads created',
-            ['page_type'],
-            registry=self.registry
-        )
-        
-        # 에러 메트릭
-        self.errors_total = Counter(
-            'errors_total',
-            'Total errors',
-            ['service', 'error_type'],
-            registry=self.registry
-        )
-        
-        # 비즈니스 메트릭
-        self.meetings_created = Counter(
-            'meetings_created_total',
-            'Total meetings created',
-            ['participants_count'],
-            registry=self.registry
+        self._bind_known_labels()
+
+        # 이벤트 루프 스레드는 링 버퍼에 append만 하고, 실제 반영은 드레인 스레드가 수행
+        self._queue: Deque[tuple] = collections.deque(maxlen=RING_BUFFER_SIZE)
+        self._dropped_samples = 0
+        self._reported_drops = 0
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # 드레인 스레드는 첫 기록 또는 메트릭 서버 시작 시 생성 (import만 하는 스크립트는 스레드 없음)
+        self._drain_thread: Optional[threading.Thread] = None
+        self._drain_start_lock = threading.Lock()
+
+        # 실행 기록: record_xxx(라벨1, 라벨2, status, duration)
+        append = self._append
+        self.record_discord_command = _make_recorder(
+            append, self.discord_commands, self.discord_command_duration,
+            _bucket_user, observe_second=False,
         )
-        
-        self.tasks_created = Counter(
-            'tasks_created_total',
-            'Total tasks created',
-            ['priority', 'person'],
-            registry=self.registry
+        self.record_notion_api_call = _make_recorder(
+            append, self.notion_api_calls, self.notion_api_duration,
+            _intern, observe_second=False,
         )
-        
-        self.documents_created = Counter(
-            'documents_created_total',
-            'Total documents created',
-            ['doc_type'],
-            registry=self.registry
+        self.record_mongodb_query = _make_recorder(
+            append, self.mongodb_queries, self.mongodb_query_duration,
+            _intern, observe_second=True,
         )
     
-    def record_discord_command(self, command: str, user: str, status: str, duration: float):
-        """Discord 명령어 실행 기록"""
-        self.discord_commands.labels(
-            command=command,
-            user=user,
-            status=status
-        ).inc()
-        
-        self.discord_command_duration.labels(
-            command=command
-        ).observe(duration)
-    
-    def record_notion_api_call(self, operation: str, database: str, status: str, duration: float):
-        """Notion API 호출 기록"""
-        self.notion_api_calls.labels(
-            operation=operation,
-            database=database,
-            status=status
-        ).inc()
-        
-        self.notion_api_duration.labels(
-            operation=operation
-        ).observe(duration)
-    
-    def record_mongodb_query(self, operation: str, collection: str, status: str, duration: float):
-        """MongoDB 쿼리 기록"""
-        self.mongodb_queries.labels(
-            operation=operation,
-            collection=collection,
-            status=status
-        ).inc()
-        
-        self.mongodb_query_duration.labels(
-            operation=operation,
-            collection=collection
-        ).observe(duration)
-    
+    def _init_metrics(self):
+        """메트릭 초기화 (_METRIC_SPECS 기반)"""
+        for spec in _METRIC_SPECS:
+            setattr(self, spec[0], _build_metric(spec, self.registry))
+
+    def _bind_known_labels(self):
+        """KNOWN_LABELS의 자식 메트릭을 미리 생성해 속성으로 바인딩 (만료 대상에서 제외)"""
+        for metric_name, label_values in KNOWN_LABELS.items():
+            metric = getattr(self, metric_name)
+            for label_value in label_values:
+                self._pinned_series.add((metric, (label_value,)))
+                self._child(metric, label_value)
+
+        # 고정 라벨 자식만 복사해 보관 (만료로 제거되는 임의 라벨과 분리)
+        self._threads_by_type = dict(self._child_cache[id(self.discord_threads_created)])
+        self._documents_by_type = dict(self._child_cache[id(self.documents_created)])
+        # id(metric) -> 미리 생성된 자식 (드레인 시 _child보다 먼저 조회)
+        self._prebound: Dict[int, Dict[tuple, Any]] = {
+            id(self.discord_threads_created): self._threads_by_type,
+            id(self.documents_created): self._documents_by_type,
+        }
+
+    def _child(self, metric, *labelvalues):
+        """라벨 값 튜플로 자식 메트릭 조회 (최초 1회만 labels() 호출)"""
+        if not labelvalues:
+            return metric
+        cache = self._child_cache.get(id(metric))
+        if cache is None:
+            cache = self._child_cache[id(metric)] = {}
+        child = cache.get(labelvalues)
+        if child is None:
+            child = cache[labelvalues] = metric.labels(*labelvalues)
+
+        key = (metric, labelvalues)
+        if key not in self._pinned_series:
+            self._last_touch[key] = time.monotonic()
+            self._last_touch.move_to_end(key)
+            if len(self._last_touch) > self.max_series:
+                self._remove_series(*self._last_touch.popitem(last=False)[0])
+        return child
+
+    def _remove_series(self, metric, labelvalues: tuple):
+        """자식 메트릭을 캐시와 레지스트리에서 제거"""
+        self._child_cache.get(id(metric), {}).pop(labelvalues, None)
+        try:
+            metric.remove(*labelvalues)
+        except KeyError:
+            pass
+
+    def _evict_expired(self, now: float):
+        """TTL 동안 갱신되지 않은 시계열 제거"""
+        cutoff = now - self.metric_expiration_seconds
+        with self._flush_lock:
+            while self._last_touch:
+                key, touched_at = next(iter(self._last_touch.items()))
+                if touched_at >= cutoff:
+                    break
+                del self._last_touch[key]
+                self._remove_series(*key)
+
+    def _ensure_drain_thread(self):
+        """드레인 스레드가 없으면 시작 (여러 스레드에서 호출해도 한 번만 생성)"""
+        with self._drain_start_lock:
+            if self._drain_thread is None and not self._stop_event.is_set():
+                self._drain_thread = threading.Thread(
+                    target=self._drain_loop, name='metrics-drain', daemon=True
+                )
+                self._drain_thread.start()
+
+    def _append(self, item: tuple):
+        """링 버퍼에 기록 (가득 차서 가장 오래된 항목이 밀려나면 버림 카운터 증가)"""
+        if self._drain_thread is None:
+            self._ensure_drain_thread()
+        if len(self._queue) >= RING_BUFFER_SIZE:
+            self._dropped_samples += 1
+            self.samples_dropped.inc()
+        self._queue.append(item)
+
+    def _enqueue_inc(self, metric, labelvalues: tuple, amount: float = 1):
+        """카운터 증가를 링 버퍼에 기록 (실제 반영은 드레인 스레드)"""
+        self._append((_OP_INC, metric, labelvalues, amount))
+
+    def _enqueue_observe(self, metric, labelvalues: tuple, value: float):
+        """히스토그램 관측값을 링 버퍼에 기록"""
+        self._append((_OP_OBSERVE, metric, labelvalues, value))
+
+    def _enqueue_set(self, metric, labelvalues: tuple, value: float):
+        """게이지 값을 링 버퍼에 기록"""
+        self._append((_OP_SET, metric, labelvalues, value))
+
+    def _report_drops(self):
+        """직전 보고 이후 버려진 샘플이 있으면 경고 로그 (드레인 주기당 최대 1회)"""
+        dropped = self._dropped_samples
+        if dropped > self._reported_drops:
+            logger.warning(
+                "⚠️ 메트릭 링 버퍼 포화로 샘플 %d개 버림 (누적 %d개)",
+                dropped - self._reported_drops,
+                dropped,
+            )
+            self._reported_drops = dropped
+
+    def flush(self):
+        """링 버퍼에 쌓인 메트릭을 배치 단위로 반영"""
+        with self._flush_lock:
+            queue = self._queue
+            while queue:
+                # 카운터별 {라벨 튜플: 증가 합계} 누적 (같은 라벨은 inc() 1회로 반영)
+                increments = collections.defaultdict(collections.Counter)
+                for _ in range(min(len(queue), DRAIN_BATCH_SIZE)):
+                    op, metric, labelvalues, value = queue.popleft()
+                    if op is _OP_INC:
+                        increments[metric][labelvalues] += value
+                    else:
+                        child = self._child(metric, *labelvalues)
+                        if op is _OP_OBSERVE:
+                            child.observe(value)
+                        else:
+                            child.set(value)
+
+                for metric, totals in increments.items():
+                    prebound = self._prebound.get(id(metric), {})
+                    for labelvalues, amount in totals.items():
+                        child = prebound.get(labelvalues)
+                        if child is None:
+                            child = self._child(metric, *labelvalues)
+                        child.inc(amount)
+
+    def _drain_loop(self):
+        """백그라운드 드레인 스레드 본체"""
+        while not self._stop_event.wait(DRAIN_INTERVAL_SECONDS):
+            try:
+                self.flush()
+                self._report_drops()
+                now = time.monotonic()
+                if now >= self._next_sweep:
+                    self._evict_expired(now)
+                    self._next_sweep = now + self.metric_expiration_seconds
+            except Exception as e:
+                logger.error(f"❌ 메트릭 반영 실패: {e}")
+
+    def shutdown(self, join_timeout: float = 2.0):
+        """드레인 스레드 종료를 기다린 뒤 남은 메트릭 반영"""
+        self._stop_event.set()
+        if self._drain_thread is not None:
+            self._drain_thread.join(join_timeout)
+        self.flush()
+
+    def time_discord_command(self, command: str, user: str) -> _Timer:
+        """Discord 명령어 실행 시간 측정 (with 블록 종료 시 기록)"""
+        return _Timer(self.record_discord_command, (command, user))
+
+    def time_notion_api_call(self, operation: str, database: str) -> _Timer:
+        """Notion API 호출 시간 측정"""
+        return _Timer(self.record_notion_api_call, (operation, database))
+
+    def time_mongodb_query(self, operation: str, collection: str) -> _Timer:
+        """MongoDB 쿼리 시간 측정"""
+        return _Timer(self.record_mongodb_query, (operation, collection))
+
     def record_error(self, service: str, error_type: str):
         """에러 기록"""
-        self.errors_total.labels(
-            service=service,
-            error_type=error_type
-        ).inc()
+        self._enqueue_inc(self.errors_total, (_intern(service), _intern(error_type)))
     
     def update_active_users(self, count: int):
         """활성 사용자 수 업데이트"""
-        self.active_users.set(count)
+        self._enqueue_set(self.active_users, (), count)
     
     def update_notion_pages_synced(self, database: str, count: int):
         """동기화된 Notion 페이지 수 업데이트"""
-        self.notion_pages_synced.labels(
-            database=database
-        ).set(count)
+        self._enqueue_set(self.notion_pages_synced, (_intern(database),), count)
     
     def record_discord_thread_created(self, page_type: str):
         """Discord 스레드 생성 기록"""
-        self.discord_threads_created.labels(
-            page_type=page_type
-        ).inc()
+        self._enqueue_inc(self.discord_threads_created, (_intern(page_type),))
     
     def record_meeting_created(self, participants_count: int):
         """회의 생성 기록"""
-        self.meetings_created.labels(
-            participants_count=str(participants_count)
-        ).inc()
+        self._enqueue_inc(self.meetings_created, (_bucket_participants(participants_count),))
     
     def record_task_created(self, priority: str, person: str):
         """작업 생성 기록"""
-        self.tasks_created.labels(
-            priority=priority,
-            person=person
-        ).inc()
+        self._enqueue_inc(self.tasks_created, (_intern(priority), _bucket_person(person)))
     
     def record_document_created(self, doc_type: str):
         """문서 생성 기록"""
-        self.documents_created.labels(
-            doc_type=doc_type
-        ).inc()
+        self._enqueue_inc(self.documents_created, (_intern(doc_type),))
     
     def start_metrics_server(self, port: int = 9090):
         """메트릭 서버 시작"""
+        self._ensure_drain_thread()
         try:
             start_http_server(port, registry=self.registry)
-            logger.info(f"📊 Prometheus 메트릭 서버 시작: http://localhost:{port}/metrics")
+            logger.info("📊 Prometheus 메트릭 서버 시작: http://localhost:%d/metrics", port)
         except Exception as e:
-            logger.error(f"❌ 메트릭 서버 시작 실패: {e}")
+            logger.error("❌ 메트릭 서버 시작 실패: %s", e)
 
 # 전역 메트릭 수집기 인스턴스
 metrics_collector = MetricsCollector()
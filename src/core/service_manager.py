@@ -3,16 +3,24 @@
 모든 서비스의 생성, 의존성 주입, 생명주기를 관리
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import asyncio
 
 from src.core.logger import get_logger, logger_manager
 from src.core.config import settings
+from src.dto.common.enums import CommandType
 
 # 워크플로우 서비스들은 순환 import를 피하기 위해 함수 내부에서 import
 
 logger = get_logger("service_manager")
 
+# 커맨드 타입 → (워크플로우 서비스 키, 처리 메서드명) 라우팅 테이블
+_WORKFLOW_ROUTES: Dict[CommandType, Tuple[str, str]] = {
+    CommandType.MEETING: ("meeting_workflow", "create_meeting"),
+    CommandType.DOCUMENT: ("document_workflow", "create_document"),
+    CommandType.TASK: ("task_workflow", "create_task"),
+}
+
 
 class ServiceManager:
     """
@@ -49,10 +57,10 @@ class ServiceManager:
 
     async def _initialize_core_services(self):
         """핵심 서비스들 초기화"""
-        # NotionService 초기화
-        from src.service.notion.notion_service import NotionService
+        # NotionService 초기화 (모듈 전역 인스턴스를 공유해 HTTP 커넥션 재사용)
+        from src.service.notion.notion_service import notion_service
 
-        self._services["notion"] = NotionService()
+        self._services["notion"] = notion_service
 
         # DiscordService 초기화
         from src.service.discord.discord_service import DiscordService
@@ -140,21 +148,15 @@ class ServiceManager:
 
     async def _handle_discord_command(self, request):
         """Discord 커맨드 처리 콜백"""
-        from src.dto.common.enums import CommandType
+        # 커맨드 타입에 따라 적절한 워크플로우 서비스로 라우팅 (dict 조회 1회)
+        route = _WORKFLOW_ROUTES.get(request.command_type)
+        if route is None:
+            # 기본적으로는 원래 로직 유지 (검색, 통계 등)
+            return None
 
+        service_name, method_name = route
         try:
-            # 커맨드 타입에 따라 적절한 워크플로우 서비스로 라우팅
-            if request.command_type == CommandType.MEETING:
-                return await self._services["meeting_workflow"].create_meeting(request)
-            elif request.command_type == CommandType.DOCUMENT:
-                return await self._services["document_workflow"].create_document(
-                    request
-                )
-            elif request.command_type == CommandType.TASK:
-                return await self._services["task_workflow"].create_task(request)
-            else:
-                # 기본적으로는 원래 로직 유지 (검색, 통계 등)
-                return None
+            return await getattr(self._services[service_name], method_name)(request)
 
         except Exception as e:
             logger.error(f"❌ Discord 커맨드 처리 실패: {e}")
@@ -4,6 +4,18 @@ Base DTO class for all data transfer objects
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_json(model: BaseModel, **kwargs) -> str:
+    """Encode with orjson when available, otherwise with pydantic-core"""
+    if orjson is None or "indent" in kwargs:
+        return BaseModel.model_dump_json(model, **kwargs)
+    return orjson.dumps(model.model_dump(mode="json", **kwargs)).decode()
+
 
 class BaseDTO(BaseModel):
     """Base class for all DTOs"""
@@ -16,5 +28,5 @@ class BaseDTO(BaseModel):
     }
 
     def model_dump_json(self, **kwargs):
-        """Serialize datetime objects to ISO format"""
-        return super().model_dump_json(mode="json", **kwargs)
\ No newline at end of file
+        """Serialize to JSON (datetime as ISO)"""
+        return _encode_json(self, **kwargs)
@@ -26,6 +26,18 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 
 
+# MongoDB 스레드 캐시 문서 → 스레드 DTO 변환 키와 기본값 (같은 순서)
+_THREAD_DOC_KEYS = (
+    "channel_id",
+    "thread_name",
+    "thread_id",
+    "created_at",
+    "last_used",
+    "use_count",
+)
+_THREAD_DOC_DEFAULTS = (None, None, None, None, None, 0)
+
+
 # DTOConverter는 별도 파일로 분리 예정
 class DTOConverter:
     """DTO conversion utilities (Legacy - to be moved)"""
@@ -64,11 +76,9 @@ class DTOConverter:
     @staticmethod
     def mongodb_doc_to_thread_dto(mongodb_doc: dict) -> Dict[str, Any]:
         """Convert MongoDB document to thread DTO format"""
-        return {
-            "channel_id": mongodb_doc.get("channel_id"),
-            "thread_name": mongodb_doc.get("thread_name"),
-            "thread_id": mongodb_doc.get("thread_id"),
-            "created_at": mongodb_doc.get("created_at"),
-            "last_used": mongodb_doc.get("last_used"),
-            "use_count": mongodb_doc.get("use_count", 0),
-        }
+        return dict(
+            zip(
+                _THREAD_DOC_KEYS,
+                map(mongodb_doc.get, _THREAD_DOC_KEYS, _THREAD_DOC_DEFAULTS),
+            )
+        )
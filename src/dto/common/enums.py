@@ -6,7 +6,11 @@ from enum import Enum
 
 
 class CommandType(str, Enum):
-    """Discord command type enumeration"""
+    """Discord command type enumeration
+
+    str 값(.value)이 메트릭 라벨과 MongoDB 집계 키로 저장되므로 IntEnum으로 바꾸지 않음
+    (디스패치는 dict 조회라 비교 비용이 병목이 아님)
+    """
 
     TASK = "task"  # Factory Tracker DB에 Task 생성
     MEETING = "meeting"  # Board DB에 회의록 생성
@@ -2,9 +2,10 @@
 Discord 관련 DTO classes
 """
 
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import Field
+from pydantic import Field, PrivateAttr, model_validator
 
 from src.dto.common.base_dto import BaseDTO
 from src.dto.common.enums import MessageType, CommandType
@@ -13,6 +14,8 @@ from src.dto.common.enums import MessageType, CommandType
 class DiscordUserDTO(BaseDTO):
     """Discord user information"""
 
+    model_config = {"frozen": True}
+
     user_id: int = Field(..., description="Discord user ID")
     username: str = Field(..., description="Discord username")
     display_name: Optional[str] = Field(default=None, description="Display name")
@@ -21,14 +24,51 @@ class DiscordUserDTO(BaseDTO):
 class DiscordGuildDTO(BaseDTO):
     """Discord server information"""
 
+    model_config = {"frozen": True}
+
     guild_id: int = Field(..., description="Discord server ID")
     channel_id: Optional[int] = Field(default=None, description="Channel ID")
     thread_id: Optional[int] = Field(default=None, description="Thread ID")
 
 
+# Minimum search query length (after stripping whitespace)
+MIN_SEARCH_QUERY_LENGTH = 2
+
+
+@dataclass(slots=True)
+class CommandParameters:
+    """Typed view of the parameters read by the stats/search workflows"""
+
+    days: Optional[int] = None
+    query: Optional[str] = None
+    page_type: Optional[str] = None
+    user_filter: Optional[str] = None
+
+    @classmethod
+    def from_parameters(cls, parameters: Dict[str, Any]) -> "CommandParameters":
+        """Build from the raw command parameter dict"""
+        return cls(
+            days=parameters.get("days"),
+            query=parameters.get("query"),
+            page_type=parameters.get("page_type"),
+            user_filter=parameters.get("user_filter"),
+        )
+
+    def days_or(self, default: int) -> int:
+        """Requested day range, or the workflow's default when not given"""
+        return default if self.days is None else self.days
+
+    @property
+    def has_search_query(self) -> bool:
+        """Whether query is long enough to run a search"""
+        return bool(self.query) and len(self.query.strip()) >= MIN_SEARCH_QUERY_LENGTH
+
+
 class DiscordCommandRequestDTO(BaseDTO):
     """Discord slash command request"""
 
+    model_config = {"frozen": True}
+
     command_type: CommandType = Field(..., description="Command type")
     user: DiscordUserDTO = Field(..., description="Command user")
     guild: DiscordGuildDTO = Field(..., description="Server information")
@@ -45,18 +85,34 @@ class DiscordCommandRequestDTO(BaseDTO):
     message_id: Optional[int] = Field(default=None, description="Message ID of the command")
     interaction_id: Optional[str] = Field(default=None, description="Discord interaction ID")
 
+    # Parsed once at construction so workflows read attributes instead of dict keys
+    _typed_params: CommandParameters = PrivateAttr(default_factory=CommandParameters)
 
-class DiscordMessageResponseDTO(BaseDTO):
-    """Discord message response"""
+    @model_validator(mode="after")
+    def _parse_typed_params(self) -> "DiscordCommandRequestDTO":
+        self._typed_params = CommandParameters.from_parameters(self.parameters)
+        return self
 
-    message_type: MessageType = Field(..., description="Message type")
-    content: str = Field(..., description="Message content")
-    title: Optional[str] = Field(default=None, description="Message title (for embed)")
-    is_embed: bool = Field(default=False, description="Use embed format")
-    is_ephemeral: bool = Field(default=False, description="Show to user only")
-    attachments: Optional[List[str]] = Field(
-        default=None, description="File attachment paths"
-    )
+    @property
+    def typed_params(self) -> CommandParameters:
+        """Typed command parameters"""
+        return self._typed_params
+
+
+@dataclass(frozen=True, slots=True)
+class DiscordMessageResponseDTO:
+    """Discord message response (slotted dataclass: built on every reply, no validation)"""
+
+    message_type: MessageType  # Message type
+    content: str  # Message content
+    title: Optional[str] = None  # Message title (for embed)
+    is_embed: bool = False  # Use embed format
+    is_ephemeral: bool = False  # Show to user only
+    attachments: Optional[List[str]] = None  # File attachment paths
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict"""
+        return asdict(self)
 
 
 class ThreadInfoDTO(BaseDTO):
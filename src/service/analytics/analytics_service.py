@@ -5,18 +5,26 @@
 - 회의 참석 패턴 분석
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, NamedTuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 from src.core.database import get_meetup_collection, mongodb_connection
 from src.core.logger import get_logger
 from src.core.exceptions import safe_execution
-from .chart_service import ChartGeneratorService
 
 logger = get_logger("services.analytics")
 
 
+class AnalyticsResult(NamedTuple):
+    """통계 조회 결과 (워크플로우에서 dict 키 조회 대신 속성으로 접근)"""
+
+    success: bool
+    stats: Dict[str, Any]
+    message: str
+    error: Optional[str] = None
+
+
 class SimpleStatsService:
     """간단한 통계 분석 서비스"""
 
@@ -795,6 +803,9 @@ class SimpleStatsService:
         self, stats: Dict[str, Any], stats_type: str
     ) -> Optional[str]:
         """통계 데이터로 차트 이미지 생성"""
+        # matplotlib/seaborn 로딩 비용이 커서 첫 차트 생성 시에만 임포트
+        from .chart_service import ChartGeneratorService
+
         try:
             if stats_type == "daily":
                 chart_service = ChartGeneratorService()
@@ -825,6 +836,19 @@ class SimpleStatsService:
             logger.error(f"❌ 차트 생성 실패 ({stats_type}): {e}")
             return None
 
+    async def get_stats_result(
+        self, stats_method, *args, stats_type: str, **kwargs
+    ) -> AnalyticsResult:
+        """통계 데이터와 Discord 메시지를 AnalyticsResult로 반환 (실패 시 success=False)"""
+        try:
+            stats = await stats_method(*args, **kwargs)
+            return AnalyticsResult(
+                True, stats, self.format_stats_message(stats, stats_type)
+            )
+        except Exception as e:
+            logger.error(f"❌ 통계 생성 실패 ({stats_type}): {e}")
+            return AnalyticsResult(False, {}, "", str(e))
+
     async def get_stats_with_chart(
         self, stats_method, *args, stats_type: str, **kwargs
     ) -> Dict[str, Any]:
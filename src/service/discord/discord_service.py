@@ -877,26 +877,20 @@ class DiscordService(IDiscordService):
         start_time = datetime.now()
 
         try:
-            # 요청 DTO 생성
+            # 요청 DTO 생성 (사용자/서버 정보는 discord.py가 타입을 보장하므로 검증 생략)
             request = DiscordCommandRequestDTO(
                 command_type=command,
-                user=DiscordUserDTO(
+                user=DiscordUserDTO.model_construct(
                     user_id=interaction.user.id,
                     username=interaction.user.name,
                     display_name=interaction.user.display_name,
-                    avatar_url=(
-                        interaction.user.avatar.url if interaction.user.avatar else None
-                    ),
                 ),
-                guild=DiscordGuildDTO(
+                guild=DiscordGuildDTO.model_construct(
                     guild_id=interaction.guild_id or 0,
-                    guild_name=(
-                        interaction.guild.name if interaction.guild else "Unknown"
-                    ),
                     channel_id=interaction.channel_id,
                 ),
                 parameters=parameters,
-                execution_time=start_time,
+                executed_at=start_time,
             )
 
             # 비즈니스 로직 콜백 호출
@@ -910,7 +904,7 @@ class DiscordService(IDiscordService):
                 response = DiscordMessageResponseDTO(
                     message_type=MessageType.ERROR_NOTIFICATION,
                     content="❌ 명령어 처리 시스템이 초기화되지 않았습니다.",
-                    ephemeral=True,
+                    is_ephemeral=True,
                 )
 
             # Discord 응답 전송
@@ -1027,15 +1021,15 @@ class DiscordService(IDiscordService):
                     message_type=MessageType.SYSTEM_STATUS,
                     title="시스템 상태",
                     content=status_message,
-                    embed=True,
-                    ephemeral=True,
+                    is_embed=True,
+                    is_ephemeral=True,
                 )
 
             # 다른 명령어들은 비즈니스 로직에서 처리
             return DiscordMessageResponseDTO(
                 message_type=MessageType.COMMAND_RESPONSE,
                 content="명령어 처리를 위해 비즈니스 로직 콜백이 필요합니다.",
-                ephemeral=True,
+                is_ephemeral=True,
             )
 
         except Exception as processing_error:
@@ -1172,7 +1166,6 @@ class DiscordService(IDiscordService):
                 parent_channel_id=channel_id,
                 created_date=date.strftime("%Y-%m-%d"),
                 created_time=date,
-                last_used_time=datetime.now(),
                 usage_count=1,
             )
 
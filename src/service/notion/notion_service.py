@@ -10,8 +10,16 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from notion_client import Client as NotionClient
 import asyncio
+import httpx
 import random
 
+try:
+    import h2  # noqa: F401  # HTTP/2 지원 (선택 의존성)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from src.core.config import settings
 from src.core.database import schema_cache_manager, metrics_collector
 from src.core.logger import get_logger, logger_manager
@@ -25,6 +33,15 @@ from src.core.decorators import track_notion_api
 logger = get_logger("services.notion")
 
 
+# Notion API HTTP 커넥션 풀 설정
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+
+def _build_http_client() -> httpx.Client:
+    """keep-alive 커넥션 풀을 가진 httpx 클라이언트 생성 (h2 설치 시 HTTP/2 멀티플렉싱)"""
+    return httpx.Client(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+
+
 def notion_retry(max_retries: int = 3, backoff_factor: float = 1.0):
     """Notion API 호출 재시도 데코레이터"""
 
@@ -94,10 +111,32 @@ class NotionService:
     def __init__(self):
         # Notion API 2025-09-03 버전으로 업그레이드
         self.notion_api_client = NotionClient(
-            auth=settings.notion_token, notion_version="2025-09-03"
+            auth=settings.notion_token,
+            notion_version="2025-09-03",
+            client=_build_http_client(),
         )
+        # 구버전 API 클라이언트는 필요할 때 한 번만 생성 (HTTP 커넥션 풀 재사용)
+        self._legacy_api_client: Optional[NotionClient] = None
         # Notion service manager initialization complete (로그 제거)
 
+    @property
+    def legacy_api_client(self) -> NotionClient:
+        """2022-06-28 버전 API 클라이언트 (databases.retrieve 폴백용)"""
+        if self._legacy_api_client is None:
+            self._legacy_api_client = NotionClient(
+                auth=settings.notion_token,
+                notion_version="2022-06-28",
+                client=_build_http_client(),
+            )
+        return self._legacy_api_client
+
+    async def shutdown(self):
+        """HTTP 클라이언트 커넥션 정리"""
+        self.notion_api_client.close()
+        if self._legacy_api_client is not None:
+            self._legacy_api_client.close()
+            self._legacy_api_client = None
+
     # -------------------
     # 노션 값 빌더 메서드들 (정적 메서드로 유틸리티 제공)
     # -------------------
@@ -191,12 +230,7 @@ class NotionService:
 
                 if not data_sources:
                     # 데이터 소스를 찾을 수 없으면 기존 방법 사용
-                    from notion_client import Client as NotionClientLegacy
-
-                    legacy_client = NotionClientLegacy(
-                        auth=settings.notion_token, notion_version="2022-06-28"
-                    )
-                    raw_response = legacy_client.databases.retrieve(
+                    raw_response = self.legacy_api_client.databases.retrieve(
                         database_id=notion_db_id
                     )
                 else:
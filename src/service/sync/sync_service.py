@@ -38,6 +38,8 @@ class SyncService:
         # Performance optimization cache
         self._notion_page_cache = {}  # Maps page_id -> last_modification_timestamp
         self._last_successful_sync_timestamp = None
+        # 첫 동기화 패스 완료 신호 (성공/실패와 무관하게 첫 시도 후 set)
+        self.initial_sync_complete = asyncio.Event()
 
     @safe_execution("start_sync_monitor")
     async def start_continuous_synchronization_monitor(self):
@@ -200,11 +202,13 @@ class SyncService:
                     self._last_successful_sync_timestamp = datetime.now()
 
                 await self.sync_notion_pages()
+                self.initial_sync_complete.set()
                 await asyncio.sleep(self.synchronization_interval_seconds)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"❌ 동기화 루프 오류: {e}")
+                self.initial_sync_complete.set()
                 await asyncio.sleep(60)  # 오류 시 1분 대기
 
     @safe_execution("sync_notion_pages")
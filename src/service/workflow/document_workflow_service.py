@@ -2,6 +2,7 @@
 문서 생성 워크플로우 서비스
 """
 
+import asyncio
 from typing import Optional
 
 from src.dto.discord.discord_dtos import (
@@ -41,11 +42,11 @@ class DocumentWorkflowService(BaseWorkflowService):
                 unique_title, doc_type
             )
 
-            # 4. 데이터베이스 저장
-            await self._save_to_database(notion_result, unique_title, doc_type, request)
-
-            # 5. 스레드 안내 메시지 전송
-            await self._send_thread_notification(request, unique_title, page_url)
+            # 4~5. DB 저장과 스레드 안내 메시지 전송을 동시에 수행 (각각 실패 시 로깅 후 계속)
+            await asyncio.gather(
+                self._save_to_database(notion_result, unique_title, doc_type, request),
+                self._send_thread_notification(request, unique_title, page_url),
+            )
 
             # 6. 응답 생성
             return self._build_document_success_response(unique_title)
@@ -2,6 +2,7 @@
 회의록 생성 워크플로우 서비스
 """
 
+import asyncio
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -36,17 +37,14 @@ class MeetingWorkflowService(BaseWorkflowService):
             meeting_request = self._prepare_meeting_data(request)
             notion_result, page_url = await self._create_notion_page(meeting_request)
 
-            # 3. 데이터베이스 저장
-            await self._save_to_database(notion_result, meeting_request, request)
-
-            # 4. Discord 이벤트 생성
-            discord_event_created = await self._create_discord_event(
-                request, meeting_request, page_url
-            )
-
-            # 5. 스레드 안내 메시지 전송
-            await self._send_thread_notification(
-                request, meeting_request, page_url, notion_result
+            # 3~5. DB 저장 / Discord 이벤트 생성 / 스레드 안내는 서로 독립적이므로 동시에 수행
+            # (각 단계는 내부에서 실패를 로깅하고 삼킴)
+            _, discord_event_created, _ = await asyncio.gather(
+                self._save_to_database(notion_result, meeting_request, request),
+                self._create_discord_event(request, meeting_request, page_url),
+                self._send_thread_notification(
+                    request, meeting_request, page_url, notion_result
+                ),
             )
 
             # 6. 응답 생성
@@ -342,30 +340,34 @@ class MeetingWorkflowService(BaseWorkflowService):
         title = request.parameters.get("title") or request.parameters.get("name")
         meeting_date_str = request.parameters.get("meeting_date")
 
-        response_content = (
+        # 응답 조각을 리스트에 모은 뒤 한 번에 결합
+        response_parts = [
             f"✅ **회의록 생성 완료**\n"
             f"📝 **제목**: `{title}` → `{meeting_request.title}`\n"
             f"🏷️ **유형**: `{meeting_request.meeting_type}`\n"
             f"🔗 **노션 링크**: {page_url}\n\n"
             f"📝 당일 스레드에 작성 가이드를 전송했습니다."
-        )
+        ]
 
         if meeting_request.attendees:
-            participants_string = ", ".join(meeting_request.attendees)
-            response_content += f"\n👥 **참석자**: `{participants_string}`"
+            response_parts.append(
+                f"\n👥 **참석자**: `{', '.join(meeting_request.attendees)}`"
+            )
 
         # Discord 이벤트 생성 결과 추가
         if meeting_date_str:
-            response_content += f"\n🎯 **회의 일정**: `{meeting_date_str}`"
+            response_parts.append(f"\n🎯 **회의 일정**: `{meeting_date_str}`")
             if discord_event_created:
-                response_content += (
-                    f"\n📅 Discord 이벤트가 '내 회의실' 음성 채널에 생성되었습니다."
+                response_parts.append(
+                    "\n📅 Discord 이벤트가 '내 회의실' 음성 채널에 생성되었습니다."
                 )
             else:
-                response_content += (
-                    f"\n⚠️ Discord 이벤트 생성에 실패했습니다. (날짜 형식 확인 필요)"
+                response_parts.append(
+                    "\n⚠️ Discord 이벤트 생성에 실패했습니다. (날짜 형식 확인 필요)"
                 )
 
+        response_content = "".join(response_parts)
+
         return DiscordMessageResponseDTO(
             message_type=MessageType.COMMAND_RESPONSE,
             title="회의록 생성 완료",
@@ -5,72 +5,118 @@ DB 스키마 확인 스크립트
 """
 
 import asyncio
-from src.service.notion.notion_service import NotionService
+import sys
+from typing import List
+
+from notion_client import APIErrorCode, APIResponseError
+from src.service.notion.notion_service import notion_service
 from src.core.config import settings
 
 
+def _find_rate_limit_error(error: BaseException):
+    """래핑된 예외 체인에서 Notion rate limit 오류 탐색"""
+    while error is not None:
+        if (
+            isinstance(error, APIResponseError)
+            and error.code == APIErrorCode.RateLimited
+        ):
+            return error
+        error = getattr(error, "original_exception", None) or error.__cause__
+    return None
+
+
+async def _with_retry(coro_factory, attempts: int):
+    """rate limit(429) 시 Retry-After 또는 2**n초 대기 후 재시도"""
+    attempts = max(1, attempts)
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            rate_limit_error = _find_rate_limit_error(e)
+            if rate_limit_error is None or attempt == attempts - 1:
+                raise
+
+            headers = getattr(rate_limit_error, "headers", None) or {}
+            wait_time = float(headers.get("retry-after", 2**attempt))
+            print(f"⏳ Notion rate limit - {wait_time:.1f}초 후 재시도")
+            await asyncio.sleep(wait_time)
+
+
+def _append_options(
+    buf: List[str], prop_type: str, prop_info: dict, label: str, indent: str
+):
+    """Select/Multi-select/Status 옵션 출력 라인 추가"""
+    if prop_type in ["select", "multi_select", "status"]:
+        options = prop_info.get(prop_type, {}).get("options", [])
+        if options:
+            option_names = ", ".join(opt.get("name", "") for opt in options)
+            buf.append(f"{indent}{label}: {option_names}")
+
+
+def _render_schema(
+    buf: List[str], name: str, emoji: str, result, highlight_important: bool = False
+):
+    """gather 결과(스키마 dict 또는 예외)를 출력 버퍼에 추가"""
+    buf.append(f"\n{emoji} {name} SCHEMA")
+    buf.append("-" * 40)
+
+    if isinstance(result, BaseException):
+        buf.append(f"❌ {name} 스키마 조회 실패: {result}")
+        if highlight_important:
+            import traceback
+
+            buf.append("".join(traceback.format_exception(result)).rstrip("\n"))
+        return
+
+    buf.append(f"Title Property: {result['title_prop']}")
+    if highlight_important:
+        buf.append(f"Total Properties: {len(result['props'])}")
+    buf.append("\nProperties:")
+    for prop_name, prop_info in result["props"].items():
+        prop_type = prop_info.get("type", "unknown")
+        buf.append(f"  - {prop_name}: {prop_type}")
+        _append_options(buf, prop_type, prop_info, "Options", "    ")
+
+        # Status와 Participants 속성 특별 확인
+        if highlight_important and prop_name.lower() in ["status", "participants"]:
+            buf.append(f"    ⭐ 중요 속성 발견: {prop_name} ({prop_type})")
+            _append_options(buf, prop_type, prop_info, "사용 가능한 옵션", "      ")
+
+
 async def check_database_schemas():
     """데이터베이스 스키마 확인"""
-    notion_service = NotionService()
-
-    print("=" * 60)
-    print("📊 NOTION DATABASE SCHEMA CHECK")
-    print("=" * 60)
+    header = ["=" * 60, "📊 NOTION DATABASE SCHEMA CHECK", "=" * 60]
+    sys.stdout.write("\n".join(header) + "\n")
 
-    # Factory Tracker DB 스키마 확인
-    print("\n🏭 FACTORY TRACKER DB SCHEMA")
-    print("-" * 40)
-    try:
-        factory_schema = await notion_service.get_database_schema(
-            settings.factory_tracker_db_id
+    # 두 DB 스키마를 동시에 조회 (네트워크 왕복 시간 중첩)
+    attempts = settings.api_retry_attempts
+    factory_task = asyncio.create_task(
+        _with_retry(
+            lambda: notion_service.get_database_schema(settings.factory_tracker_db_id),
+            attempts,
+        )
+    )
+    board_task = asyncio.create_task(
+        _with_retry(
+            lambda: notion_service.get_database_schema(settings.board_db_id),
+            attempts,
         )
-        print(f"Title Property: {factory_schema['title_prop']}")
-        print("\nProperties:")
-        for prop_name, prop_info in factory_schema["props"].items():
-            prop_type = prop_info.get("type", "unknown")
-            print(f"  - {prop_name}: {prop_type}")
-            if prop_type in ["select", "multi_select", "status"]:
-                options = prop_info.get(prop_type, {}).get("options", [])
-                if options:
-                    option_names = [opt.get("name", "") for opt in options]
-                    print(f"    Options: {', '.join(option_names)}")
-    except Exception as e:
-        print(f"❌ Factory Tracker DB 스키마 조회 실패: {e}")
-
-    # Board DB 스키마 확인
-    print("\n📋 BOARD DB SCHEMA")
-    print("-" * 40)
+    )
     try:
-        board_schema = await notion_service.get_database_schema(settings.board_db_id)
-        print(f"Title Property: {board_schema['title_prop']}")
-        print(f"Total Properties: {len(board_schema['props'])}")
-        print("\nProperties:")
-        for prop_name, prop_info in board_schema["props"].items():
-            prop_type = prop_info.get("type", "unknown")
-            print(f"  - {prop_name}: {prop_type}")
-            if prop_type in ["select", "multi_select", "status"]:
-                options = prop_info.get(prop_type, {}).get("options", [])
-                if options:
-                    option_names = [opt.get("name", "") for opt in options]
-                    print(f"    Options: {', '.join(option_names)}")
-
-            # Status와 Participants 속성 특별 확인
-            if prop_name.lower() in ["status", "participants"]:
-                print(f"    ⭐ 중요 속성 발견: {prop_name} ({prop_type})")
-                if prop_type in ["select", "multi_select", "status"]:
-                    options = prop_info.get(prop_type, {}).get("options", [])
-                    if options:
-                        option_names = [opt.get("name", "") for opt in options]
-                        print(f"      사용 가능한 옵션: {', '.join(option_names)}")
-    except Exception as e:
-        print(f"❌ Board DB 스키마 조회 실패: {e}")
-        import traceback
-
-        traceback.print_exc()
-
-    print("\n" + "=" * 60)
-    print("✅ 스키마 확인 완료")
-    print("=" * 60)
+        factory_schema, board_schema = await asyncio.gather(
+            factory_task, board_task, return_exceptions=True
+        )
+    finally:
+        await notion_service.shutdown()
+
+    # 출력 순서는 고정, 섹션 전체를 한 번의 write로 출력
+    buf: List[str] = []
+    _render_schema(buf, "FACTORY TRACKER DB", "🏭", factory_schema)
+    _render_schema(buf, "BOARD DB", "📋", board_schema, highlight_important=True)
+    buf.append("\n" + "=" * 60)
+    buf.append("✅ 스키마 확인 완료")
+    buf.append("=" * 60)
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,66 +5,97 @@
 """
 
 import asyncio
+from src.core.config import settings
 from src.core.database import mongodb_connection, get_meetup_collection
 from src.core.logger import get_logger
 
 logger = get_logger("cleanup")
 
+# 잘못된 page_id 조건 (분류는 MongoDB 서버에서 수행)
+INVALID_PAGE_ID_FILTER = {
+    "$or": [
+        {"page_id": {"$exists": False}},
+        {"page_id": ""},
+        {"page_id": None},
+        {"page_id": {"$regex": "^\\s*$"}},
+    ]
+}
+
+# 로그 미리보기로 표시할 최대 항목 수
+PREVIEW_LIMIT = 50
+
+
+async def delete_in_batches(collection, batch_size: int) -> int:
+    """잘못된 항목을 _id 배치 단위로 삭제 (단일 대량 삭제로 인한 I/O 점유 방지)"""
+    batch_size = max(1, batch_size)
+    deleted_total = 0
+
+    while True:
+        ids = [
+            doc["_id"]
+            async for doc in collection.find(INVALID_PAGE_ID_FILTER, {"_id": 1}).limit(
+                batch_size
+            )
+        ]
+        if not ids:
+            break
+
+        result = await collection.delete_many({"_id": {"$in": ids}})
+        deleted_total += result.deleted_count
+        logger.info(f"🧹 배치 삭제: {result.deleted_count}개 (누적 {deleted_total}개)")
+
+        # 삭제가 진행되지 않으면 무한 루프 방지
+        if result.deleted_count == 0:
+            break
+
+    return deleted_total
+
+
 async def cleanup_invalid_entries():
     """잘못된 데이터베이스 항목 정리"""
     try:
         # MongoDB 연결
         await mongodb_connection.connect_database()
         logger.info("📊 MongoDB 연결 완료")
-        
+
         collection = get_meetup_collection("notion_pages")
-        
-        # 현재 데이터 확인
-        all_entries = await collection.find({}).to_list(None)
-        logger.info(f"📋 총 데이터베이스 항목: {len(all_entries)}개")
-        
-        # 각 항목의 페이지 ID 상태 확인
-        valid_entries = []
-        invalid_entries = []
-        
-        for entry in all_entries:
-            page_id = entry.get("page_id")
-            title = entry.get("title", "제목 없음")
-            
-            if not page_id or not str(page_id).strip():
-                invalid_entries.append({
-                    "title": title,
-                    "page_id": page_id,
-                    "_id": entry.get("_id")
-                })
-            else:
-                valid_entries.append(entry)
-        
-        logger.info(f"✅ 유효한 항목: {len(valid_entries)}개")
-        logger.info(f"❌ 잘못된 항목: {len(invalid_entries)}개")
-        
-        if invalid_entries:
+
+        # page_id 인덱스가 있으면 힌트로 사용
+        index_info = await collection.index_information()
+        count_options = {"hint": "page_id_1"} if "page_id_1" in index_info else {}
+
+        # 전체 문서를 메모리로 가져오지 않고 서버에서 개수만 집계
+        total_count = await collection.count_documents({}, hint="_id_")
+        invalid_count = await collection.count_documents(
+            INVALID_PAGE_ID_FILTER, **count_options
+        )
+        valid_count = total_count - invalid_count
+
+        logger.info(f"📋 총 데이터베이스 항목: {total_count}개")
+        logger.info(f"✅ 유효한 항목: {valid_count}개")
+        logger.info(f"❌ 잘못된 항목: {invalid_count}개")
+
+        if invalid_count:
             logger.info("🔍 잘못된 항목들:")
-            for entry in invalid_entries:
-                logger.info(f"  - {entry['title']} (page_id: '{entry['page_id']}')")
-            
+            preview_cursor = collection.find(
+                INVALID_PAGE_ID_FILTER, {"title": 1, "page_id": 1}
+            ).limit(PREVIEW_LIMIT)
+            async for entry in preview_cursor:
+                title = entry.get("title", "제목 없음")
+                logger.info(f"  - {title} (page_id: '{entry.get('page_id')}')")
+            if invalid_count > PREVIEW_LIMIT:
+                logger.info(f"  ... 외 {invalid_count - PREVIEW_LIMIT}개")
+
             # 잘못된 항목들 삭제 (자동)
-            result = await collection.delete_many({
-                "$or": [
-                    {"page_id": {"$exists": False}},
-                    {"page_id": ""},
-                    {"page_id": None},
-                    {"page_id": {"$regex": "^\\s*$"}}
-                ]
-            })
-            
-            logger.info(f"🧹 {result.deleted_count}개 항목 자동 삭제 완료")
+            deleted_count = await delete_in_batches(collection, settings.batch_size)
+
+            logger.info(f"🧹 {deleted_count}개 항목 자동 삭제 완료")
         else:
             logger.info("✅ 모든 항목이 유효합니다!")
-    
+
     except Exception as e:
         logger.error(f"❌ 정리 중 오류 발생: {e}")
-    
+
     finally:
         if mongodb_connection.mongo_client:
             mongodb_connection.mongo_client.close()
@@ -73,4 +104,4 @@ async def cleanup_invalid_entries():
 if __name__ == "__main__":
     print("🧹 데이터베이스 정리 스크립트 시작")
     asyncio.run(cleanup_invalid_entries())
-    print("✅ 정리 완료")
\ No newline at end of file
+    print("✅ 정리 완료")